@@ -4,60 +4,99 @@ Health check script for the LangChain Documentation Server.
 """
 
 from src.config.settings import settings
+import asyncio
 import sys
-import requests
 from pathlib import Path
+from typing import Optional, Sequence
+
+import httpx
 
 # Add src to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+# Endpoints probed by default
+DEFAULT_PATHS = ("/health",)
+
 
-def health_check(host: str = None, port: int = None) -> bool:
+async def probe(client: httpx.AsyncClient, url: str) -> bool:
     """
-    Check if the server is healthy.
+    Probe a single endpoint.
 
     Args:
-        host: Server host (defaults to settings.host)
-        port: Server port (defaults to settings.port)
+        client: Shared HTTP client
+        url: Endpoint URL
 
     Returns:
-        True if server is healthy, False otherwise
+        True if the endpoint responded with 200, False otherwise
     """
-    host = host or settings.host
-    port = port or settings.port
-
-    # Use localhost instead of 0.0.0.0 for health checks
-    if host == "0.0.0.0":
-        host = "localhost"
-
-    url = f"http://{host}:{port}/health"
-
     try:
-        response = requests.get(url, timeout=10)
+        response = await client.get(url)
 
         if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Server is healthy!")
-            print(f"   Service: {data.get('service', 'Unknown')}")
-            print(f"   Status: {data.get('status', 'Unknown')}")
-            print(f"   Timestamp: {data.get('timestamp', 'Unknown')}")
+            print(f"✅ {url} is healthy!")
+            if url.endswith("/health"):
+                data = response.json()
+                print(f"   Service: {data.get('service', 'Unknown')}")
+                print(f"   Status: {data.get('status', 'Unknown')}")
+                print(f"   Timestamp: {data.get('timestamp', 'Unknown')}")
             return True
-        else:
-            print(f"❌ Server returned status code {response.status_code}")
-            return False
 
-    except requests.exceptions.ConnectionError:
+        print(f"❌ {url} returned status code {response.status_code}")
+        return False
+
+    except httpx.ConnectError:
         print(f"❌ Cannot connect to server at {url}")
         return False
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print(f"❌ Server at {url} timed out")
         return False
     except Exception as e:
-        print(f"❌ Health check failed: {e}")
+        print(f"❌ Health check failed for {url}: {e}")
         return False
 
 
+async def probe_all(base_url: str, paths: Sequence[str]) -> bool:
+    """
+    Probe several endpoints concurrently over one connection pool.
+
+    Args:
+        base_url: Server base URL
+        paths: Endpoint paths to probe
+
+    Returns:
+        True if every endpoint is healthy, False otherwise
+    """
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=10)
+    async with httpx.AsyncClient(timeout=10, limits=limits) as client:
+        results = await asyncio.gather(
+            *(probe(client, f"{base_url}{path}") for path in paths))
+    return all(results)
+
+
+def health_check(host: str = None, port: int = None,
+                 paths: Optional[Sequence[str]] = None) -> bool:
+    """
+    Check if the server is healthy.
+
+    Args:
+        host: Server host (defaults to settings.host)
+        port: Server port (defaults to settings.port)
+        paths: Endpoint paths to probe (defaults to /health)
+
+    Returns:
+        True if server is healthy, False otherwise
+    """
+    host = host or settings.host
+    port = port or settings.port
+
+    # Use localhost instead of 0.0.0.0 for health checks
+    if host == "0.0.0.0":
+        host = "localhost"
+
+    return asyncio.run(probe_all(f"http://{host}:{port}", paths or DEFAULT_PATHS))
+
+
 def main():
     """Main function."""
     import argparse
@@ -66,11 +105,13 @@ def main():
         description="Health check for LangChain Documentation Server")
     parser.add_argument("--host", default=None, help="Server host")
     parser.add_argument("--port", type=int, default=None, help="Server port")
+    parser.add_argument("--path", action="append", dest="paths", default=None,
+                        help="Endpoint path to probe (repeatable, default: /health)")
 
     args = parser.parse_args()
 
     print("Performing health check...")
-    healthy = health_check(args.host, args.port)
+    healthy = health_check(args.host, args.port, args.paths)
 
     sys.exit(0 if healthy else 1)
 
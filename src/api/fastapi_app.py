@@ -2,14 +2,23 @@
 FastAPI application with all routes and endpoints.
 """
 
-from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import List, Optional
-
-from fastapi import FastAPI, HTTPException, Query
+import asyncio
+import functools
+import hashlib
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import Annotated, Any, AsyncIterator, Callable, Hashable, List, Optional
+
+import anyio
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from ..config.settings import settings
-from ..config.logging import get_logger
+from ..config.logging import get_logger, setup_logging
 from ..services.langchain_service import LangChainDocumentationService
 from ..models.schemas import (
     DocSearchResult,
@@ -23,17 +32,198 @@ from ..utils.exceptions import (
     LangChainServiceError,
     DocumentationNotFoundError,
 )
+from ..utils.batching import SearchBatcher
+from ..utils.cache import TTLCache
+from ..utils.redis_cache import RedisCache
 from ..utils.helpers import validate_max_results
+from .middleware import AccessLogMiddleware, ETagMiddleware
 
 logger = get_logger(__name__)
 
+# Compiled once; validate service objects and dump JSON bytes in pydantic-core
+_TUTORIALS_ADAPTER = TypeAdapter(List[TutorialInfo])
+_GITHUB_EXAMPLE_ADAPTER = TypeAdapter(GitHubExample)
+_SEARCH_RESULT_ADAPTER = TypeAdapter(DocSearchResult)
+
+
+def _dump(adapter: TypeAdapter, value: Any) -> bytes:
+    """Serialize a service result (or list of them) straight to JSON bytes."""
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+# Serialized bodies of cached service results, keyed per endpoint/parameters
+_rendered = TTLCache(ttl=settings.cache_ttl, max_entries=256)
+
+
+def _cached_json(key: Hashable, source: Any, render: Callable[[], bytes]) -> Response:
+    """
+    Build a JSON response, reusing the body rendered for the same source.
+
+    The service caches its results, so a cache hit hands back the very same
+    object; in that case the previously serialized bytes are returned
+    without validating or dumping the models again.
+
+    Args:
+        key: Endpoint and parameters the body was rendered for
+        source: Service result the body is derived from
+        render: Produces the body when it is not cached
+
+    Returns:
+        JSON response with the serialized body
+    """
+    entry = _rendered.get(key)
+    if entry is None or entry[0] is not source:
+        entry = (source, render())
+        _rendered.set(key, entry)
+    return Response(content=entry[1], media_type="application/json")
+
+
+# Shared across workers when REDIS_ENABLED; a no-op until connected
+response_cache = RedisCache(settings.get_redis_url(),
+                            max_connections=settings.redis_max_connections)
+
+# Response headers replayed on cache hits (e.g. the source-SHA ETag)
+_CACHED_HEADERS = ("etag", "cache-control")
+
+
+def cached(prefix: str, expire: int = settings.cache_ttl):
+    """
+    Cache an endpoint's JSON response body in Redis.
+
+    The key is ``prefix`` plus a digest of the endpoint's keyword arguments.
+    Only 200 responses with a fixed body are stored; streamed responses and
+    errors pass through untouched.
+
+    Args:
+        prefix: Key prefix naming the endpoint
+        expire: Time-to-live in seconds
+
+    Returns:
+        Decorator for async endpoint functions
+    """
+    def decorator(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not response_cache.enabled:
+                return await endpoint(*args, **kwargs)
+
+            # Key on request parameters only, not on injected dependencies
+            params = sorted((name, value) for name, value in kwargs.items()
+                            if value is None or isinstance(value, (str, int, float)))
+            digest = hashlib.blake2b(orjson.dumps(params), digest_size=16).hexdigest()
+            key = f"{prefix}:{digest}"
+
+            hit = await response_cache.get(key)
+            if hit is not None:
+                # Stored as "<headers json>\n<body>"; orjson never emits newlines
+                headers, _, body = hit.partition(b"\n")
+                return Response(content=body, media_type="application/json",
+                                headers=orjson.loads(headers))
+
+            response = await endpoint(*args, **kwargs)
+            body = getattr(response, "body", None)
+            if isinstance(response, Response) and response.status_code == 200 and body:
+                headers = {name: response.headers[name]
+                           for name in _CACHED_HEADERS if name in response.headers}
+                await response_cache.set(
+                    key, orjson.dumps(headers) + b"\n" + body, expire)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+_END = object()
+
+
+async def _stream_json_list(items: AsyncIterator[Any], adapter: TypeAdapter) -> StreamingResponse:
+    """
+    Stream service results as a JSON array, validating each item with ``adapter``.
+
+    The first item is awaited before the response starts, so failures in the
+    initial upstream lookup still surface as an error status. After that the
+    status has been sent: a later failure is logged and the array is closed
+    early, so clients may receive fewer items than requested.
+    """
+    first = await anext(items, _END)
+    first_json = b"" if first is _END else _dump(adapter, first)
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"["
+        if first is not _END:
+            yield first_json
+            try:
+                async for item in items:
+                    yield b"," + _dump(adapter, item)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("JSON array stream ended early: %s", str(e))
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+async def _stream_ndjson(items: AsyncIterator[Any], adapter: TypeAdapter) -> StreamingResponse:
+    """
+    Stream service results as newline-delimited JSON, one line per item.
+
+    Items are validated with ``adapter`` as in _stream_json_list; likewise
+    the first item is awaited up front so an initial upstream failure still
+    becomes an error status, and a later failure is logged and ends the
+    stream early.
+    """
+    first = await anext(items, _END)
+    first_json = b"" if first is _END else _dump(adapter, first)
+
+    async def body() -> AsyncIterator[bytes]:
+        if first is not _END:
+            yield first_json + b"\n"
+            try:
+                async for item in items:
+                    yield _dump(adapter, item) + b"\n"
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("NDJSON stream ended early: %s", str(e))
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+async def _refresh_static_data() -> None:
+    """Keep the tutorials and version caches loaded, refreshing ahead of expiry."""
+    while True:
+        await doc_service.refresh_static_data()
+        await asyncio.sleep(settings.cache_ttl * 0.8)
+
 
 @asynccontextmanager
-def lifespan(app: FastAPI):
+async def lifespan(application: FastAPI):
+    """Application startup and shutdown."""
+    # Spawned uvicorn workers and the reloader child don't inherit the
+    # parent's logging setup, so configure it here unless already done
+    if not logging.getLogger().handlers:
+        setup_logging()
     logger.info("Starting %s v%s", settings.app_name, settings.version)
     logger.info("Debug mode: %s", settings.debug)
+    # Build the OpenAPI schema now rather than on the first /docs request
+    application.openapi()
+    # Bound the threadpool so stray sync work cannot grow threads unchecked
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.threadpool_size
+    if settings.redis_enabled:
+        await response_cache.connect()
+    # Load in the background so startup doesn't wait on upstream sites
+    refresher = (asyncio.create_task(_refresh_static_data())
+                 if settings.prewarm_cache else None)
     yield
     logger.info("Shutting down application")
+    if refresher is not None:
+        refresher.cancel()
+        # Let it unwind before the clients it may be using are closed
+        with suppress(asyncio.CancelledError):
+            await refresher
+    await search_batcher.aclose()
+    await api_search_batcher.aclose()
+    await response_cache.aclose()
+    await doc_service.aclose()
 
 
 # Initialize FastAPI app
@@ -43,11 +233,52 @@ app = FastAPI(
     version=settings.version,
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Conditional GET support for slowly-changing read endpoints
+app.add_middleware(
+    ETagMiddleware,
+    paths=("/latest-version", "/tutorials", "/api-reference/"),
+    max_age=settings.cache_ttl,
 )
 
+# Compress larger JSON bodies; added last so it wraps the ETag middleware
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# One record per request; skipped when uvicorn's own access log is enabled
+if not settings.access_log:
+    app.add_middleware(AccessLogMiddleware)
+
 # Initialize the documentation service
 doc_service = LangChainDocumentationService()
 
+# Coalesce concurrent searches so identical queries share one upstream fetch
+search_batcher = SearchBatcher(
+    lambda query, limit: doc_service.search_documentation(query, limit))
+api_search_batcher = SearchBatcher(
+    lambda query, limit: doc_service.search_api_reference(query, limit))
+
+
+# Dependencies (async, so FastAPI resolves them without a threadpool hop);
+# tests can swap them through app.dependency_overrides
+async def get_doc_service() -> LangChainDocumentationService:
+    """Provide the shared documentation service."""
+    return doc_service
+
+
+async def get_search_batcher() -> SearchBatcher:
+    """Provide the batcher for documentation searches."""
+    return search_batcher
+
+
+async def get_api_search_batcher() -> SearchBatcher:
+    """Provide the batcher for API reference searches."""
+    return api_search_batcher
+
+
+DocService = Annotated[LangChainDocumentationService, Depends(get_doc_service)]
+
 
 @app.exception_handler(LangChainServiceError)
 async def langchain_service_exception_handler(_request, exc: LangChainServiceError):
@@ -56,44 +287,69 @@ async def langchain_service_exception_handler(_request, exc: LangChainServiceErr
     raise HTTPException(status_code=exc.status_code, detail=exc.message)
 
 
+# Static part of the /health payload; only the timestamp changes
+_HEALTH_PAYLOAD = HealthResponse(
+    status="ok",
+    service=settings.app_name,
+    timestamp="",
+    endpoints_available=7,
+    data_sources=[
+        "python.langchain.com",
+        "github.com/langchain-ai/langchain",
+        "pypi.org/project/langchain"
+    ],
+    features=[
+        "documentation_search",
+        "api_reference_lookup",
+        "github_examples",
+        "tutorials",
+        "version_info"
+    ],
+    architecture="shared_service_layer"
+).model_dump()
+
+_health_body = b""
+_health_second = -1
+
+
+def _render_health() -> bytes:
+    """Return the serialized /health payload, refreshed at most once per second."""
+    global _health_body, _health_second  # pylint: disable=global-statement
+
+    second = int(time.time())
+    if second != _health_second:
+        _HEALTH_PAYLOAD["timestamp"] = time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _health_body = orjson.dumps(_HEALTH_PAYLOAD)
+        _health_second = second
+    return _health_body
+
+
 @app.get("/health", response_model=HealthResponse, summary="Health check endpoint")
-def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint to verify the service is running.
 
     Returns:
         Service status and current timestamp
     """
-    return HealthResponse(
-        status="ok",
-        service=settings.app_name,
-        timestamp=datetime.now().isoformat(),
-        endpoints_available=7,
-        data_sources=[
-            "python.langchain.com",
-            "github.com/langchain-ai/langchain",
-            "pypi.org/project/langchain"
-        ],
-        features=[
-            "documentation_search",
-            "api_reference_lookup",
-            "github_examples",
-            "tutorials",
-            "version_info"
-        ],
-        architecture="shared_service_layer"
-    )
+    return Response(content=_render_health(), media_type="application/json")
 
 
 @app.get("/search",
          response_model=List[DocSearchResult],
          summary="Search LangChain documentation")
+@cached("search")
 async def search_documentation(
-    query: str = Query(...,
-                       description="Search query for LangChain documentation"),
-    max_results: int = Query(
-        10, ge=1, le=50, description="Maximum number of results to return")
-) -> List[DocSearchResult]:
+    query: Annotated[str, Query(
+        description="Search query for LangChain documentation")],
+    batcher: Annotated[SearchBatcher, Depends(get_search_batcher)],
+    service: DocService,
+    max_results: Annotated[int, Query(
+        ge=1, le=50, description="Maximum number of results to return")] = 10,
+    stream: Annotated[bool, Query(
+        description="Stream results as NDJSON as each section responds")] = False
+) -> Response:
     """
     Search through LangChain documentation with the given query.
 
@@ -102,12 +358,17 @@ async def search_documentation(
     """
     try:
         max_results = validate_max_results(max_results)
-        logger.info("Searching documentation for query: %s", query)
+        logger.debug("Searching documentation for query: %s", query)
 
-        results = await doc_service.search_documentation(query, max_results)
+        if stream:
+            return await _stream_ndjson(
+                service.iter_search_documentation(query, max_results),
+                _SEARCH_RESULT_ADAPTER)
 
-        logger.info("Found %d results for query: %s", len(results), query)
-        return [DocSearchResult.from_service(result) for result in results]
+        results = await batcher.process((query, max_results))
+
+        # Service results already have the DocSearchResult shape
+        return ORJSONResponse(results)
 
     except Exception as e:
         logger.error("Search failed for query '%s': %s", query, str(e))
@@ -118,12 +379,14 @@ async def search_documentation(
 @app.get("/search/api",
          response_model=List[DocSearchResult],
          summary="Search API reference documentation")
+@cached("search-api")
 async def search_api_documentation(
-    query: str = Query(...,
-                       description="Search query for LangChain API reference"),
-    max_results: int = Query(
-        10, ge=1, le=50, description="Maximum number of results to return")
-) -> List[DocSearchResult]:
+    query: Annotated[str, Query(
+        description="Search query for LangChain API reference")],
+    batcher: Annotated[SearchBatcher, Depends(get_api_search_batcher)],
+    max_results: Annotated[int, Query(
+        ge=1, le=50, description="Maximum number of results to return")] = 10
+) -> Response:
     """
     Search specifically through LangChain API reference documentation.
 
@@ -132,13 +395,12 @@ async def search_api_documentation(
     """
     try:
         max_results = validate_max_results(max_results)
-        logger.info("Searching API reference for query: %s", query)
+        logger.debug("Searching API reference for query: %s", query)
 
-        results = await doc_service.search_api_reference(query, max_results)
+        results = await batcher.process((query, max_results))
 
-        logger.info(
-            "Found %d API reference results for query: %s", len(results), query)
-        return [DocSearchResult.from_service(result) for result in results]
+        # Service results already have the DocSearchResult shape
+        return ORJSONResponse(results)
 
     except Exception as e:
         logger.error("API search failed for query '%s': %s", query, str(e))
@@ -149,7 +411,8 @@ async def search_api_documentation(
 @app.get("/api-reference/{class_name}",
          response_model=APIReference,
          summary="Get detailed API reference for a specific class")
-async def get_api_reference(class_name: str) -> APIReference:
+@cached("api-reference")
+async def get_api_reference(class_name: str, service: DocService) -> Response:
     """
     Get detailed API reference information for a specific LangChain class.
 
@@ -157,15 +420,23 @@ async def get_api_reference(class_name: str) -> APIReference:
     examples, and source code links.
     """
     try:
-        logger.info("Getting API reference for class: %s", class_name)
+        logger.debug("Getting API reference for class: %s", class_name)
 
-        result = await doc_service.get_api_reference(class_name)
+        result = await service.get_api_reference(class_name)
         if result is None:
             raise DocumentationNotFoundError(
                 f"API reference for '{class_name}' not found")
 
-        logger.info("Retrieved API reference for class: %s", class_name)
-        return APIReference.from_service(result)
+        response = _cached_json(
+            ("api-reference", class_name), result,
+            lambda: APIReference.from_service(result).model_dump_json().encode())
+
+        # The source blob SHA identifies the content; ETagMiddleware keeps it
+        if result.source_sha:
+            response.headers["ETag"] = f'"{result.source_sha}"'
+            response.headers["Cache-Control"] = (
+                f"public, max-age={settings.api_reference_max_age}")
+        return response
 
     except DocumentationNotFoundError:
         raise
@@ -180,11 +451,14 @@ async def get_api_reference(class_name: str) -> APIReference:
          response_model=List[GitHubExample],
          summary="Get code examples from GitHub")
 async def get_github_examples(
-    topic: str = Query(...,
-                       description="Topic or concept to find examples for"),
-    max_results: int = Query(
-        5, ge=1, le=20, description="Maximum number of examples to return")
-) -> List[GitHubExample]:
+    topic: Annotated[str, Query(
+        description="Topic or concept to find examples for")],
+    service: DocService,
+    max_results: Annotated[int, Query(
+        ge=1, le=20, description="Maximum number of examples to return")] = 5,
+    stream: Annotated[bool, Query(
+        description="Stream examples as NDJSON instead of a JSON array")] = False
+) -> Response:
     """
     Get real code examples from the LangChain GitHub repository.
 
@@ -193,13 +467,12 @@ async def get_github_examples(
     """
     try:
         max_results = validate_max_results(max_results)
-        logger.info("Getting GitHub examples for topic: %s", topic)
+        logger.debug("Getting GitHub examples for topic: %s", topic)
 
-        results = await doc_service.get_github_examples(topic, max_results)
-
-        logger.info("Found %d GitHub examples for topic: %s",
-                    len(results), topic)
-        return [GitHubExample.from_service(result) for result in results]
+        examples = service.iter_github_examples(topic, max_results)
+        if stream:
+            return await _stream_ndjson(examples, _GITHUB_EXAMPLE_ADAPTER)
+        return await _stream_json_list(examples, _GITHUB_EXAMPLE_ADAPTER)
 
     except Exception as e:
         logger.error(
@@ -211,12 +484,14 @@ async def get_github_examples(
 @app.get("/tutorials",
          response_model=List[TutorialInfo],
          summary="Get LangChain tutorials and guides")
+@cached("tutorials")
 async def get_tutorials(
-    difficulty: Optional[str] = Query(
-        None, description="Filter by difficulty level"),
-    max_results: int = Query(
-        10, ge=1, le=30, description="Maximum number of tutorials to return")
-) -> List[TutorialInfo]:
+    service: DocService,
+    difficulty: Annotated[Optional[str], Query(
+        description="Filter by difficulty level")] = None,
+    max_results: Annotated[int, Query(
+        ge=1, le=30, description="Maximum number of tutorials to return")] = 10
+) -> Response:
     """
     Get LangChain tutorials and learning guides.
 
@@ -225,21 +500,25 @@ async def get_tutorials(
     """
     try:
         max_results = validate_max_results(max_results)
-        logger.info("Getting tutorials (difficulty: %s)", difficulty)
+        logger.debug("Getting tutorials (difficulty: %s)", difficulty)
+
+        tutorials = await service.get_tutorials()
 
-        results = await doc_service.get_tutorials()
+        def render() -> bytes:
+            results = tutorials
+            # Filter by difficulty if specified
+            if difficulty:
+                term = difficulty.lower()
+                results = [r for r in results
+                           if r.difficulty and term in r.difficulty.lower()]
 
-        # Filter by difficulty if specified
-        if difficulty:
-            results = [r for r in results if hasattr(
-                r, "difficulty") and r.difficulty and difficulty.lower() in r.difficulty.lower()]
+            # Limit results if max_results is specified
+            if max_results:
+                results = results[:max_results]
 
-        # Limit results if max_results is specified
-        if max_results:
-            results = results[:max_results]
+            return _dump(_TUTORIALS_ADAPTER, results)
 
-        logger.info("Found %d tutorials", len(results))
-        return [TutorialInfo.from_service(result) for result in results]
+        return _cached_json(("tutorials", difficulty, max_results), tutorials, render)
 
     except Exception as e:
         logger.error("Failed to get tutorials: %s", str(e))
@@ -250,7 +529,8 @@ async def get_tutorials(
 @app.get("/latest-version",
          response_model=VersionInfo,
          summary="Get latest LangChain version information")
-async def get_latest_version() -> VersionInfo:
+@cached("latest-version")
+async def get_latest_version(service: DocService) -> Response:
     """
     Get the latest LangChain version and release information.
 
@@ -258,13 +538,13 @@ async def get_latest_version() -> VersionInfo:
     including version number, release date, and requirements.
     """
     try:
-        logger.info("Getting latest LangChain version")
+        logger.debug("Getting latest LangChain version")
 
-        result = await doc_service.get_latest_version()
+        result = await service.get_latest_version()
 
-        logger.info("Retrieved version info: %s", getattr(
-            result, "latest_version", "unknown"))
-        return VersionInfo.from_service(result)
+        return _cached_json(
+            "latest-version", result,
+            lambda: VersionInfo.from_service(result).model_dump_json().encode())
 
     except Exception as e:
         logger.error("Failed to get version info: %s", str(e))
@@ -7,14 +7,14 @@ Provides LangChain documentation access through the Model Context Protocol.
 
 import asyncio
 import json
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List
 
 import mcp.server.stdio
 from mcp import types
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 
-from ..services.langchain_service import LangChainDocumentationService
+from ..services.langchain_service import LANGCHAIN_DOCS_BASE, LangChainDocumentationService
 
 
 # Initialize the MCP server
@@ -23,6 +23,44 @@ server = Server("langchain-docs")
 # Initialize the documentation service
 doc_service = LangChainDocumentationService()
 
+# Static resources never change, so serialize them once at import
+_DOCS_JSON = json.dumps({
+    "description": "LangChain Documentation Access",
+    "available_sections": [
+        "introduction",
+        "tutorials",
+        "how_to",
+        "concepts",
+        "integrations",
+        "api_reference"
+    ],
+    "usage": "Use the search_docs tool to search through documentation",
+    "base_url": LANGCHAIN_DOCS_BASE
+}, indent=2)
+
+_API_REF_JSON = json.dumps({
+    "description": "LangChain API Reference",
+    "usage": "Use the get_api_reference tool with a class name",
+    "examples": ["ChatOpenAI", "LLMChain", "VectorStoreRetriever"],
+    "github_source": "https://github.com/langchain-ai/langchain"
+}, indent=2)
+
+_EXAMPLES_JSON = json.dumps({
+    "description": "LangChain Code Examples",
+    "usage": "Use the get_github_examples tool to fetch real examples",
+    "repository": "https://github.com/langchain-ai/langchain"
+}, indent=2)
+
+_STATIC_RESOURCES: Dict[str, str] = {
+    "langchain://docs": _DOCS_JSON,
+    "langchain://api-reference": _API_REF_JSON,
+    "langchain://examples": _EXAMPLES_JSON,
+}
+
+# Code examples longer than this are truncated in tool responses
+_MAX_EXAMPLE_LEN = 500
+_TRUNCATED_SUFFIX = "...\n\n[Content truncated - see full example at URL]"
+
 
 @server.list_resources()
 async def handle_list_resources() -> List[types.Resource]:
@@ -77,29 +115,9 @@ async def handle_read_resource(uri: str) -> str:
     Returns:
         The resource content as a string
     """
-    if uri == "langchain://docs":
-        # Return general documentation overview
-        return json.dumps({
-            "description": "LangChain Documentation Access",
-            "available_sections": [
-                "introduction",
-                "tutorials",
-                "how_to",
-                "concepts",
-                "integrations",
-                "api_reference"
-            ],
-            "usage": "Use the search_docs tool to search through documentation",
-            "base_url": "https://python.langchain.com"
-        }, indent=2)
-
-    if uri == "langchain://api-reference":
-        return json.dumps({
-            "description": "LangChain API Reference",
-            "usage": "Use the get_api_reference tool with a class name",
-            "examples": ["ChatOpenAI", "LLMChain", "VectorStoreRetriever"],
-            "github_source": "https://github.com/langchain-ai/langchain"
-        }, indent=2)
+    static = _STATIC_RESOURCES.get(uri)
+    if static is not None:
+        return static
 
     if uri == "langchain://tutorials":
         tutorials = await doc_service.get_tutorials()
@@ -108,13 +126,6 @@ async def handle_read_resource(uri: str) -> str:
             "tutorials": [tutorial.to_dict() for tutorial in tutorials]
         }, indent=2)
 
-    if uri == "langchain://examples":
-        return json.dumps({
-            "description": "LangChain Code Examples",
-            "usage": "Use the get_github_examples tool to fetch real examples",
-            "repository": "https://github.com/langchain-ai/langchain"
-        }, indent=2)
-
     if uri == "langchain://version":
         version_info = await doc_service.get_latest_version()
         return json.dumps({
@@ -125,6 +136,106 @@ async def handle_read_resource(uri: str) -> str:
     raise ValueError(f"Unknown resource URI: {uri}")
 
 
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="search_docs",
+        description="Search through LangChain documentation for specific topics",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query for documentation"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (default: 10)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 20
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="search_api_reference",
+        description="Search specifically through LangChain API reference documentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query for API reference"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (default: 5)",
+                    "default": 5,
+                    "minimum": 1,
+                    "maximum": 10
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="get_api_reference",
+        description="Get detailed API reference for a specific LangChain class",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "class_name": {
+                    "type": "string",
+                    "description": ("Name of the LangChain class "
+                                    "(e.g., 'ChatOpenAI', 'LLMChain')")
+                }
+            },
+            "required": ["class_name"]
+        }
+    ),
+    types.Tool(
+        name="get_github_examples",
+        description="Get real code examples from the LangChain GitHub repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Optional search term to filter examples"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of examples (default: 5)",
+                    "default": 5,
+                    "minimum": 1,
+                    "maximum": 10
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_tutorials",
+        description="Get available LangChain tutorials and learning resources",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_latest_version",
+        description="Get the latest LangChain version information from PyPI",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+]
+
+
 @server.list_tools()
 async def handle_list_tools() -> List[types.Tool]:
     """
@@ -133,104 +244,7 @@ async def handle_list_tools() -> List[types.Tool]:
     Returns:
         List of tools that can be called
     """
-    return [
-        types.Tool(
-            name="search_docs",
-            description="Search through LangChain documentation for specific topics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query for documentation"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (default: 10)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 20
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="search_api_reference",
-            description="Search specifically through LangChain API reference documentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query for API reference"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (default: 5)",
-                        "default": 5,
-                        "minimum": 1,
-                        "maximum": 10
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="get_api_reference",
-            description="Get detailed API reference for a specific LangChain class",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "class_name": {
-                        "type": "string",
-                        "description": ("Name of the LangChain class "
-                                        "(e.g., 'ChatOpenAI', 'LLMChain')")
-                    }
-                },
-                "required": ["class_name"]
-            }
-        ),
-        types.Tool(
-            name="get_github_examples",
-            description="Get real code examples from the LangChain GitHub repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Optional search term to filter examples"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of examples (default: 5)",
-                        "default": 5,
-                        "minimum": 1,
-                        "maximum": 10
-                    }
-                },
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_tutorials",
-            description="Get available LangChain tutorials and learning resources",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_latest_version",
-            description="Get the latest LangChain version information from PyPI",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+    return _TOOLS
 
 
 async def _handle_search_docs(arguments: Dict[str, Any]) -> List[types.TextContent]:
@@ -247,19 +261,17 @@ async def _handle_search_docs(arguments: Dict[str, Any]) -> List[types.TextConte
         )]
 
     # Format results for display
-    formatted_results = []
-    for result in results:
-        formatted_results.append(
+    parts = [f"Found {len(results)} documentation results for '{query}':\n\n"]
+    for i, result in enumerate(results):
+        if i:
+            parts.append("\n---\n")
+        parts.append(
             f"**{result.title}** ({result.category})\n"
             f"URL: {result.url}\n"
             f"Summary: {result.summary}\n"
         )
 
-    return [types.TextContent(
-        type="text",
-        text=f"Found {len(results)} documentation results for '{query}':\n\n" +
-             "\n---\n".join(formatted_results)
-    )]
+    return [types.TextContent(type="text", text="".join(parts))]
 
 
 async def _handle_search_api_reference(arguments: Dict[str, Any]) -> List[types.TextContent]:
@@ -276,19 +288,17 @@ async def _handle_search_api_reference(arguments: Dict[str, Any]) -> List[types.
         )]
 
     # Format results for display
-    formatted_results = []
-    for result in results:
-        formatted_results.append(
+    parts = [f"Found {len(results)} API reference results for '{query}':\n\n"]
+    for i, result in enumerate(results):
+        if i:
+            parts.append("\n---\n")
+        parts.append(
             f"**{result.title}**\n"
             f"URL: {result.url}\n"
             f"Description: {result.summary}\n"
         )
 
-    return [types.TextContent(
-        type="text",
-        text=f"Found {len(results)} API reference results for '{query}':\n\n" +
-             "\n---\n".join(formatted_results)
-    )]
+    return [types.TextContent(type="text", text="".join(parts))]
 
 
 async def _handle_get_api_reference(arguments: Dict[str, Any]) -> List[types.TextContent]:
@@ -333,27 +343,27 @@ async def _handle_get_github_examples(arguments: Dict[str, Any]) -> List[types.T
         )]
 
     # Format examples for display
-    formatted_examples = []
-    for example in examples:
-        # Truncate content if too long
-        content = example.content
-        if len(content) > 500:
-            content = content[:500] + \
-                "...\n\n[Content truncated - see full example at URL]"
-
-        formatted_examples.append(
+    search_info = f" for '{query}'" if query else ""
+    parts = [f"Found {len(examples)} code examples{search_info}:\n\n"]
+    for i, example in enumerate(examples):
+        if i:
+            parts.append("\n\n---\n\n")
+        parts.append(
             f"**{example.filename}**\n"
             f"Description: {example.description}\n"
             f"URL: {example.url}\n"
-            f"```python\n{content}\n```"
+            "```python\n"
         )
+        # Truncate content if too long
+        content = example.content
+        if len(content) > _MAX_EXAMPLE_LEN:
+            parts.append(content[:_MAX_EXAMPLE_LEN])
+            parts.append(_TRUNCATED_SUFFIX)
+        else:
+            parts.append(content)
+        parts.append("\n```")
 
-    search_info = f" for '{query}'" if query else ""
-    return [types.TextContent(
-        type="text",
-        text=f"Found {len(examples)} code examples{search_info}:\n\n" +
-             "\n\n---\n\n".join(formatted_examples)
-    )]
+    return [types.TextContent(type="text", text="".join(parts))]
 
 
 async def _handle_get_tutorials(arguments: Dict[str, Any]) -> List[types.TextContent]:  # pylint: disable=unused-argument
@@ -367,20 +377,18 @@ async def _handle_get_tutorials(arguments: Dict[str, Any]) -> List[types.TextCon
         )]
 
     # Format tutorials for display
-    formatted_tutorials = []
-    for tutorial in tutorials:
-        formatted_tutorials.append(
+    parts = [f"Found {len(tutorials)} LangChain tutorials:\n\n"]
+    for i, tutorial in enumerate(tutorials):
+        if i:
+            parts.append("\n\n---\n\n")
+        parts.append(
             f"**{tutorial.title}** ({tutorial.category})\n"
             f"Description: {tutorial.description}\n"
             f"URL: {tutorial.url}\n"
             f"Topics: {', '.join(tutorial.topics)}"
         )
 
-    return [types.TextContent(
-        type="text",
-        text=f"Found {len(tutorials)} LangChain tutorials:\n\n" +
-             "\n\n---\n\n".join(formatted_tutorials)
-    )]
+    return [types.TextContent(type="text", text="".join(parts))]
 
 
 async def _handle_get_latest_version(arguments: Dict[str, Any]) -> List[types.TextContent]:  # pylint: disable=unused-argument
@@ -404,6 +412,16 @@ async def _handle_get_latest_version(arguments: Dict[str, Any]) -> List[types.Te
     return [types.TextContent(type="text", text=response)]
 
 
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[types.TextContent]]]] = {
+    "search_docs": _handle_search_docs,
+    "search_api_reference": _handle_search_api_reference,
+    "get_api_reference": _handle_get_api_reference,
+    "get_github_examples": _handle_get_github_examples,
+    "get_tutorials": _handle_get_tutorials,
+    "get_latest_version": _handle_get_latest_version,
+}
+
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """
@@ -416,25 +434,15 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
     Returns:
         List of text content responses
     """
-    try:
-        # Use a dictionary to map tool names to handler functions
-        handlers = {
-            "search_docs": _handle_search_docs,
-            "search_api_reference": _handle_search_api_reference,
-            "get_api_reference": _handle_get_api_reference,
-            "get_github_examples": _handle_get_github_examples,
-            "get_tutorials": _handle_get_tutorials,
-            "get_latest_version": _handle_get_latest_version,
-        }
-
-        if name in handlers:
-            return await handlers[name](arguments)
-
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         return [types.TextContent(
             type="text",
             text=f"Unknown tool: {name}"
         )]
 
+    try:
+        return await handler(arguments)
     except Exception as e:  # pylint: disable=broad-exception-caught
         return [types.TextContent(
             type="text",
@@ -450,12 +458,15 @@ async def main():
         server_version="1.0.0"
     )
 
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            options
-        )
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                options
+            )
+    finally:
+        await doc_service.aclose()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""
+HTTP middleware for the FastAPI application.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Iterable, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config.logging import get_logger
+
+access_logger = get_logger(__name__)
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for a response body.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        Quoted ETag value
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+class ETagMiddleware:
+    """
+    Add ETag/Cache-Control headers and answer conditional GETs with 304.
+
+    Implemented as plain ASGI like AccessLogMiddleware: only successful GETs
+    under ``paths`` are buffered to compute the ETag; every other request
+    and response passes straight through.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str], max_age: int = 300):
+        self.app = app
+        self.paths = tuple(paths)
+        self.max_age = max_age
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http" or scope["method"] != "GET"
+                or not scope["path"].startswith(self.paths)):
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                # Hold the headers back until the whole body is known
+                start = message
+                return
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+
+            headers = MutableHeaders(scope=start)
+            # Endpoints may provide their own validator (e.g. an upstream SHA)
+            etag = headers.get("etag") or compute_etag(body)
+            cache_control = headers.get("cache-control", f"public, max-age={self.max_age}")
+
+            if etag_matches(Headers(scope=scope).get("if-none-match"), etag):
+                await send({"type": "http.response.start", "status": 304, "headers": [
+                    (b"etag", etag.encode("latin-1")),
+                    (b"cache-control", cache_control.encode("latin-1")),
+                ]})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers["etag"] = etag
+            headers["cache-control"] = cache_control
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
+
+
+class AccessLogMiddleware:
+    """
+    Log one record per HTTP request with its status and duration.
+
+    Implemented as plain ASGI so response bodies (including streams) pass
+    through untouched; the duration covers sending the whole body.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not access_logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            access_logger.info("%s %s -> %d in %dus", scope["method"], scope["path"],
+                               status, (time.perf_counter_ns() - start) // 1000)
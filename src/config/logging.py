@@ -2,13 +2,40 @@
 Logging configuration.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
 from .settings import settings
 
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Background thread that writes queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener  # pylint: disable=global-statement
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(level: Optional[str] = None) -> None:
     """
@@ -17,6 +44,8 @@ def setup_logging(level: Optional[str] = None) -> None:
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _listener  # pylint: disable=global-statement
+
     log_level = level or settings.log_level
 
     # Create logs directory if it doesn't exist
@@ -32,11 +61,20 @@ def setup_logging(level: Optional[str] = None) -> None:
         logging.FileHandler(logs_dir / "app.log", encoding="utf-8")
     ]
 
+    # Loggers only enqueue records, already formatted by the QueueHandler;
+    # stdout and file writes happen on the listener thread so they never
+    # block the event loop
+    _stop_listener()
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     # Set up logging
     logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
+        level=_LEVELS[log_level.upper()],
         format=log_format,
-        handlers=handlers,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
         force=True
     )
 
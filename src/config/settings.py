@@ -2,8 +2,11 @@
 Application settings and configuration management.
 """
 
+import os
+from functools import lru_cache
 from typing import Optional
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -19,20 +22,39 @@ class Settings(BaseSettings):
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
+    # cpu_count() sees every host CPU, even inside a CPU-limited container
+    workers: int = Field(default_factory=lambda: min((os.cpu_count() or 1) * 2 + 1, 8))
+    access_log: bool = False
+    # Threads available to sync endpoints/dependencies (Starlette default is 40)
+    threadpool_size: int = 8
 
     # API Configuration
     langchain_docs_base: str = "https://python.langchain.com"
     github_api_base: str = "https://api.github.com/repos/langchain-ai/langchain"
     request_timeout: int = 30
 
+    # Upstream HTTP connection pool
+    http2: bool = True
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_connect_timeout: float = 5.0
+
     # Optional GitHub token for higher API limits
     github_token: Optional[str] = None
 
     # Cache settings
+    # Shared Redis response cache (requires the optional 'redis' package)
+    redis_enabled: bool = False
     redis_host: str = "localhost"
     redis_port: int = 6379
     redis_db: int = 0
+    redis_max_connections: int = 20
     cache_ttl: int = 300
+    # Load tutorials and version info at startup and refresh them before they expire
+    prewarm_cache: bool = True
+    # API references are validated by the GitHub blob SHA, so they can be cached longer
+    api_reference_max_age: int = 86400
 
     # Rate limiting
     rate_limit_requests: int = 100
@@ -43,10 +65,28 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
 
+    def get_redis_url(self) -> str:
+        """Get the Redis connection URL."""
+        return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
+
     def get_rate_limit_key(self) -> str:
         """Get the rate limit key for caching."""
         return f"rate_limit_{self.rate_limit_requests}_{self.rate_limit_window}"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings.
+
+    The environment and ``.env`` file are read once; later calls return the
+    same instance, which also makes this usable as a FastAPI dependency.
+
+    Returns:
+        Settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -16,16 +16,21 @@ sys.path.insert(0, str(Path(__file__).parent))
 def run_fastapi():
     """Run the FastAPI server."""
     import uvicorn  # pylint: disable=import-outside-toplevel
-    from .api.fastapi_app import app  # pylint: disable=import-outside-toplevel
 
     setup_logging()
 
+    # The import string form is required for multiple workers and reload.
+    # "auto" picks uvloop/httptools when installed (uvicorn[standard]).
     uvicorn.run(
-        app,
+        "src.api.fastapi_app:app",
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level.lower(),
-        reload=settings.debug
+        reload=settings.debug,
+        workers=1 if settings.debug else settings.workers,
+        loop="auto",
+        http="auto",
+        access_log=settings.access_log,
     )
 
 
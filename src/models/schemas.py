@@ -3,7 +3,7 @@ Pydantic models and schemas for API requests and responses.
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 # Import service models for conversion
 from ..services.langchain_service import (
@@ -17,6 +17,8 @@ from ..services.langchain_service import (
 
 class DocSearchResult(BaseModel):
     """Model for documentation search results."""
+    model_config = ConfigDict(from_attributes=True)
+
     title: str
     url: str
     summary: str
@@ -26,17 +28,13 @@ class DocSearchResult(BaseModel):
     @classmethod
     def from_service(cls, service_result: ServiceDocSearchResult) -> "DocSearchResult":
         """Convert from service model to API model."""
-        return cls(
-            title=service_result.title,
-            url=service_result.url,
-            summary=service_result.summary,
-            category=service_result.category,
-            last_updated=service_result.last_updated
-        )
+        return cls.model_validate(service_result)
 
 
 class APIReference(BaseModel):
     """Model for API reference information."""
+    model_config = ConfigDict(from_attributes=True)
+
     class_name: str
     module_path: str
     description: str
@@ -48,19 +46,13 @@ class APIReference(BaseModel):
     @classmethod
     def from_service(cls, service_result: ServiceAPIReference) -> "APIReference":
         """Convert from service model to API model."""
-        return cls(
-            class_name=service_result.class_name,
-            module_path=service_result.module_path,
-            description=service_result.description,
-            methods=service_result.methods,
-            parameters=service_result.parameters,
-            examples=service_result.examples,
-            source_url=service_result.source_url
-        )
+        return cls.model_validate(service_result)
 
 
 class GitHubExample(BaseModel):
     """Model for GitHub code examples."""
+    model_config = ConfigDict(from_attributes=True)
+
     filename: str
     content: str
     url: str
@@ -69,32 +61,25 @@ class GitHubExample(BaseModel):
     @classmethod
     def from_service(cls, service_result: ServiceGitHubExample) -> "GitHubExample":
         """Convert from service model to API model."""
-        return cls(
-            filename=service_result.filename,
-            content=service_result.content,
-            url=service_result.url,
-            description=service_result.description
-        )
+        return cls.model_validate(service_result)
 
 
 class TutorialInfo(BaseModel):
     """Model for tutorial information."""
+    model_config = ConfigDict(from_attributes=True)
+
     title: str
     url: str
     description: str
-    difficulty: str
-    estimated_time: str
+    category: str
+    topics: List[str]
+    difficulty: Optional[str] = None
+    estimated_time: Optional[str] = None
 
     @classmethod
     def from_service(cls, service_result: ServiceTutorialInfo) -> "TutorialInfo":
         """Convert from service model to API model."""
-        return cls(
-            title=service_result.title,
-            url=service_result.url,
-            description=service_result.description,
-            difficulty=service_result.difficulty,
-            estimated_time=service_result.estimated_time
-        )
+        return cls.model_validate(service_result)
 
 
 class VersionInfo(BaseModel):
@@ -111,21 +96,15 @@ class VersionInfo(BaseModel):
     @classmethod
     def from_service(cls, service_result: Any) -> "VersionInfo":
         """Convert from service model to API model."""
-        def safe_str(val):
-            return val if isinstance(val, str) and val is not None else ""
-        return cls(
-            latest_version=safe_str(
-                getattr(service_result, "latest_version", "")),
-            description=safe_str(getattr(service_result, "description", "")),
-            author=safe_str(getattr(service_result, "author", "")),
-            homepage=safe_str(getattr(service_result, "homepage", "")),
-            release_date=safe_str(getattr(service_result, "release_date", "")),
-            python_requires=safe_str(
-                getattr(service_result, "python_requires", "")),
-            pypi_url=safe_str(getattr(service_result, "pypi_url", "")),
-            documentation_url=safe_str(
-                getattr(service_result, "documentation_url", "")),
-        )
+        # Every field is coerced to str here, so validation can be skipped
+        data = {}
+        for name in _VERSION_FIELDS:
+            value = getattr(service_result, name, "")
+            data[name] = value if isinstance(value, str) else ""
+        return cls.model_construct(**data)
+
+
+_VERSION_FIELDS = tuple(VersionInfo.model_fields)
 
 
 class HealthResponse(BaseModel):
@@ -7,30 +7,133 @@ the FastAPI server and the MCP server implementations.
 # pylint: disable=too-few-public-methods,too-many-arguments,too-many-positional-arguments
 # pylint: disable=too-many-instance-attributes,line-too-long,use-maxsplit-arg,too-many-nested-blocks
 
+import ast
+import asyncio
+import functools
+import html
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, quote
 
 import httpx
-from bs4 import BeautifulSoup
-
-
-# Configuration constants
-LANGCHAIN_DOCS_BASE = "https://python.langchain.com"
-GITHUB_API_BASE = "https://api.github.com/repos/langchain-ai/langchain"
-REQUEST_TIMEOUT = 30
-
-
+import lxml.html
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+from ..config.logging import get_logger
+from ..config.settings import settings
+from ..utils.cache import TTLCache, async_ttl_cache
+
+logger = get_logger(__name__)
+
+
+# Configuration constants (single source of truth is the application settings)
+LANGCHAIN_DOCS_BASE = settings.langchain_docs_base
+GITHUB_API_BASE = settings.github_api_base
+GITHUB_API_HOST = httpx.URL(GITHUB_API_BASE).host
+REQUEST_TIMEOUT = settings.request_timeout
+
+# Identifies this server to upstream hosts (GitHub asks clients to send one)
+USER_AGENT = f"langchain-mcp-server/{settings.version}"
+
+# How long upstream ETag/Last-Modified validators are kept for revalidation
+VALIDATOR_TTL = 24 * 60 * 60
+
+# Upstream pages and JSON fetched without revalidation are reused this long
+PAGE_CACHE_TTL = settings.cache_ttl
+PAGE_CACHE_ENTRIES = 256
+
+# Sections to search through (updated with latest LangChain structure)
+SEARCH_SECTIONS = (
+    "/docs/introduction/",
+    "/docs/tutorials/",
+    "/docs/how_to/",
+    "/docs/concepts/",
+    "/docs/integrations/providers/",
+    "/api_reference/"
+)
+SEARCH_SECTION_URLS = tuple(urljoin(LANGCHAIN_DOCS_BASE, path) for path in SEARCH_SECTIONS)
+
+# Raw GitHub files downloaded at once per examples request
+GITHUB_FETCH_CONCURRENCY = 5
+
+# Files requested per GitHub GraphQL call (needs a GitHub token)
+GITHUB_GRAPHQL_URL = f"https://{GITHUB_API_HOST}/graphql"
+GITHUB_GRAPHQL_BATCH = 50
+_BLOB_URL_RE = re.compile(r'https?://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/')
+
+# Example files this long or longer are skipped (and not downloaded in full)
+MAX_EXAMPLE_CHARS = 5000
+
+# C-based parser backend for BeautifulSoup (much faster than 'html.parser')
+HTML_PARSER = "lxml"
+
+# Threads for HTML/source parsing; the work holds the GIL, so a few suffice
+PARSE_WORKERS = 4
+
+# github.com/<owner>/<repo>/blob/ -> raw.githubusercontent.com/<owner>/<repo>/
+_RAW_URL_RE = re.compile(r'https?://github\.com/([^/]+/[^/]+)/blob/')
+
+# Documentation links listed as tutorials: /docs/ pages in these sections
+_TUTORIAL_HREF_RE = re.compile(r'^/docs/.*?(?:tutorials|concepts|introduction|how_to|integrations)')
+
+# <title> and <meta name="description"> read straight from a page's <head>
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_META_DESC_RE = re.compile(
+    r'<meta\s[^>]*?\bname\s*=\s*["\']description["\'][^>]*>', re.IGNORECASE)
+_CONTENT_ATTR_RE = re.compile(r'\bcontent\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+
+# Only materialize the tutorial links when the tutorials page is parsed
+_TUTORIAL_LINKS = SoupStrainer('a', href=_TUTORIAL_HREF_RE)
+
+# Patterns for the regex fallback in extract_class_info
+_DOCSTRING_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+_METHOD_RE = re.compile(r'def (\w+)\(self')
+
+# URL path keyword -> content category
+_CATEGORY_MAP = {
+    "introduction": "Introduction",
+    "tutorials": "Tutorials",
+    "how_to": "How-To Guides",
+    "concepts": "Concepts",
+    "integrations": "Integrations",
+    "providers": "Providers",
+    "api_reference": "API Reference",
+    "chat": "Chat Models",
+    "llms": "LLMs",
+    "chains": "Chains",
+    "agents": "Agents",
+    "memory": "Memory",
+    "retrievers": "Retrievers",
+    "embeddings": "Embeddings"
+}
+# Longest keywords first so a keyword wins over any shorter one at the same position
+_CATEGORY_RE = re.compile("|".join(
+    re.escape(keyword) for keyword in sorted(_CATEGORY_MAP, key=len, reverse=True)))
+
+# The docs don't tag pages with a difficulty, so estimate it from the section
+_DIFFICULTY_BY_CATEGORY = {
+    "Introduction": "Beginner",
+    "Tutorials": "Beginner",
+    "Concepts": "Intermediate",
+    "How-To Guides": "Intermediate",
+    "Integrations": "Advanced",
+}
+
+
+@dataclass(slots=True)
 class DocSearchResult:
     """Model for documentation search results."""
 
-    def __init__(self, title: str, url: str, summary: str, category: str, last_updated: Optional[str] = None):
-        self.title = title
-        self.url = url
-        self.summary = summary
-        self.category = category
-        self.last_updated = last_updated
+    title: str
+    url: str
+    summary: str
+    category: str
+    last_updated: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -43,19 +146,18 @@ class DocSearchResult:
         }
 
 
+@dataclass(slots=True)
 class APIReference:
     """Model for API reference information."""
 
-    def __init__(self, class_name: str, module_path: str, description: str,
-                 methods: List[str], parameters: Dict[str, Any],
-                 examples: List[str], source_url: str):
-        self.class_name = class_name
-        self.module_path = module_path
-        self.description = description
-        self.methods = methods
-        self.parameters = parameters
-        self.examples = examples
-        self.source_url = source_url
+    class_name: str
+    module_path: str
+    description: str
+    methods: List[str]
+    parameters: Dict[str, Any]
+    examples: List[str]
+    source_url: str
+    source_sha: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -66,18 +168,19 @@ class APIReference:
             "methods": self.methods,
             "parameters": self.parameters,
             "examples": self.examples,
-            "source_url": self.source_url
+            "source_url": self.source_url,
+            "source_sha": self.source_sha
         }
 
 
+@dataclass(slots=True)
 class GitHubExample:
     """Model for GitHub code examples."""
 
-    def __init__(self, filename: str, content: str, url: str, description: str):
-        self.filename = filename
-        self.content = content
-        self.url = url
-        self.description = description
+    filename: str
+    content: str
+    url: str
+    description: str
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -89,15 +192,16 @@ class GitHubExample:
         }
 
 
+@dataclass(slots=True)
 class TutorialInfo:
     """Model for tutorial information."""
 
-    def __init__(self, title: str, description: str, url: str, category: str, topics: List[str]):
-        self.title = title
-        self.description = description
-        self.url = url
-        self.category = category
-        self.topics = topics
+    title: str
+    description: str
+    url: str
+    category: str
+    topics: List[str]
+    difficulty: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -106,24 +210,23 @@ class TutorialInfo:
             "description": self.description,
             "url": self.url,
             "category": self.category,
-            "topics": self.topics
+            "topics": self.topics,
+            "difficulty": self.difficulty
         }
 
 
+@dataclass(slots=True)
 class VersionInfo:
     """Model for version information."""
 
-    def __init__(self, latest_version: str, description: str, author: str,
-                 homepage: str, release_date: Optional[str], python_requires: str,
-                 pypi_url: str, documentation_url: str):
-        self.latest_version = latest_version
-        self.description = description
-        self.author = author
-        self.homepage = homepage
-        self.release_date = release_date
-        self.python_requires = python_requires
-        self.pypi_url = pypi_url
-        self.documentation_url = documentation_url
+    latest_version: str
+    description: str
+    author: str
+    homepage: str
+    release_date: Optional[str]
+    python_requires: str
+    pypi_url: str
+    documentation_url: str
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -139,58 +242,335 @@ class VersionInfo:
         }
 
 
+async def _authorize_github(request: httpx.Request) -> None:
+    """Send the configured GitHub token, but only to the GitHub API host."""
+    if settings.github_token and request.url.host == GITHUB_API_HOST:
+        request.headers["Authorization"] = f"Bearer {settings.github_token}"
+
+
+def create_http_client(timeout: float = REQUEST_TIMEOUT) -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used for upstream requests.
+
+    Args:
+        timeout: Default request timeout in seconds
+
+    Returns:
+        An async HTTP client with keep-alive pooling and HTTP/2 enabled that
+        authenticates GitHub API calls when a token is configured
+    """
+    return httpx.AsyncClient(
+        # Fail fast on unreachable hosts instead of waiting the full read timeout
+        timeout=httpx.Timeout(timeout, connect=settings.http_connect_timeout),
+        http2=settings.http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        # httpx sets Accept-Encoding from the decoders it has (br needs brotli)
+        headers={"User-Agent": USER_AGENT},
+        event_hooks={"request": [_authorize_github]},
+    )
+
+
+def to_raw_url(html_url: str) -> str:
+    """
+    Convert a GitHub file page URL to its raw download URL.
+
+    Args:
+        html_url: URL of the form https://github.com/<owner>/<repo>/blob/<ref>/<path>
+
+    Returns:
+        The raw.githubusercontent.com URL for the same file
+    """
+    return _RAW_URL_RE.sub(r'https://raw.githubusercontent.com/\1/', html_url, count=1)
+
+
+async def parse_html(content: str, strainer: Optional[SoupStrainer] = None,
+                     executor: Optional[ThreadPoolExecutor] = None) -> BeautifulSoup:
+    """
+    Parse HTML in a worker thread so the event loop stays responsive.
+
+    Args:
+        content: Raw HTML
+        strainer: Optional SoupStrainer limiting which tags are built
+        executor: Thread pool to parse in (defaults to the loop's executor)
+
+    Returns:
+        The parsed document
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(BeautifulSoup, content, HTML_PARSER, parse_only=strainer))
+
+
 class LangChainDocumentationService:
     """Core service for LangChain documentation operations."""
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.timeout = REQUEST_TIMEOUT
+        self._client = http_client
+        # url -> (etag, last_modified, body) for conditional revalidation
+        self._validators = TTLCache(ttl=VALIDATOR_TTL, max_entries=64)
+        self._parse_pool: Optional[ThreadPoolExecutor] = None
+        # Per-instance page caches keyed on (url, timeout); entries that
+        # expire are revalidated against the stored validators
+        self._cached_text = async_ttl_cache(
+            ttl=PAGE_CACHE_TTL, max_entries=PAGE_CACHE_ENTRIES)(self._revalidate_text)
+        self._cached_json = async_ttl_cache(
+            ttl=PAGE_CACHE_TTL, max_entries=PAGE_CACHE_ENTRIES)(self._revalidate_json)
+        # Result caches are per instance too, so they neither keep the
+        # service alive nor share entries with other instances
+        result_cache = async_ttl_cache(ttl=settings.cache_ttl)
+        self.get_api_reference = result_cache(self.get_api_reference)
+        self.get_tutorials = result_cache(self.get_tutorials)
+        self.get_latest_version = result_cache(self.get_latest_version)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to the upstream hosts alive
+        instead of paying a TCP + TLS handshake on every fetch.
 
-    async def fetch_url(self, url: str, timeout: int = None) -> Optional[str]:
+        Returns:
+            The shared async HTTP client
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = create_http_client(self.timeout)
+        return self._client
+
+    def _get_parse_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool for CPU-bound parsing, creating it on first use.
+
+        A dedicated pool keeps large parses from queueing behind (or
+        starving) other users of the loop's default executor.
+
+        Returns:
+            The parsing thread pool
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ThreadPoolExecutor(
+                max_workers=PARSE_WORKERS, thread_name_prefix="doc-parse")
+        return self._parse_pool
+
+    async def _parse_html(self, content: str,
+                          strainer: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML on the service's parsing pool."""
+        return await parse_html(content, strainer, self._get_parse_pool())
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and the parsing pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[tuple]) -> Dict[str, str]:
+        """Build revalidation headers from a stored (etag, last_modified, value) entry."""
+        if entry is None:
+            return {}
+
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _remember(self, url: str, response: httpx.Response, value: Any) -> None:
+        """Store a response's validators alongside the value derived from it."""
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            self._validators.set(url, (etag, last_modified, value))
+
+    async def _revalidate(self, url: str, timeout: Any) -> Tuple[httpx.Response, Any]:
+        """
+        GET a URL, conditionally when validators from an earlier response exist.
+
+        Returns:
+            The response and, on 304 Not Modified, the value stored with the
+            matching validators (otherwise None)
+        """
+        entry = self._validators.get(url)
+        response = await self._get_client().get(
+            url, timeout=timeout, headers=self._conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            self._validators.set(url, entry)
+            return response, entry[2]
+        response.raise_for_status()
+        return response, None
+
+    async def _revalidate_text(self, url: str, timeout: Any) -> str:
+        """Fetch a URL's text, raising on failure so errors are never cached."""
+        response, body = await self._revalidate(url, timeout)
+        if body is None:
+            body = response.text
+            self._remember(url, response, body)
+        return body
+
+    async def _revalidate_json(self, url: str, timeout: Any) -> Any:
+        """Fetch a URL's JSON, raising on failure so errors are never cached."""
+        response, data = await self._revalidate(url, timeout)
+        if data is None:
+            data = orjson.loads(response.content)
+            self._remember(url, response, data)
+        return data
+
+    async def fetch_url(self, url: str, timeout: int = None,
+                        conditional: bool = False) -> Optional[str]:
         """
         Fetch content from a URL with error handling.
 
+        Pages are cached for PAGE_CACHE_TTL seconds and concurrent fetches
+        of the same URL share one request. Expired pages are revalidated
+        against the last response's ETag / Last-Modified, reusing the body
+        on 304 Not Modified.
+
         Args:
             url: The URL to fetch
             timeout: Request timeout in seconds
+            conditional: Skip the page cache and revalidate now
 
         Returns:
             The response text or None if failed
         """
         if timeout is None:
-            timeout = self.timeout
+            # Keep the client's timeout config (including its connect timeout)
+            timeout = httpx.USE_CLIENT_DEFAULT
 
+        load = self._revalidate_text if conditional else self._cached_text
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url)
+            return await load(url, timeout)
+        except (httpx.RequestError, httpx.HTTPStatusError) as error:
+            logger.warning("Error fetching %s: %s", url, error)
+            return None
+
+    async def fetch_text_limited(self, url: str, max_chars: int,
+                                 timeout: int = None) -> Optional[str]:
+        """
+        Fetch text from a URL, giving up once it reaches ``max_chars``.
+
+        The body is streamed, so oversized files are abandoned after the
+        first chunks instead of being downloaded in full.
+
+        Args:
+            url: The URL to fetch
+            max_chars: Length at which the content is rejected
+            timeout: Request timeout in seconds
+
+        Returns:
+            The response text, or None if it failed or was too long
+        """
+        if timeout is None:
+            # Keep the client's timeout config (including its connect timeout)
+            timeout = httpx.USE_CLIENT_DEFAULT
+
+        try:
+            async with self._get_client().stream("GET", url, timeout=timeout) as response:
                 response.raise_for_status()
-                return response.text
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_text():
+                    size += len(chunk)
+                    if size >= max_chars:
+                        return None
+                    chunks.append(chunk)
+                return "".join(chunks)
         except (httpx.RequestError, httpx.HTTPStatusError) as error:
-            print(f"Error fetching {url}: {error}")
+            logger.warning("Error fetching %s: %s", url, error)
             return None
 
-    async def fetch_json(self, url: str, timeout: int = None) -> Optional[Dict]:
+    async def fetch_json(self, url: str, timeout: int = None,
+                         conditional: bool = False) -> Optional[Dict]:
         """
         Fetch JSON content from a URL with error handling.
 
+        Cached and revalidated like :meth:`fetch_url`; the returned data is
+        shared and must not be modified.
+
         Args:
             url: The URL to fetch JSON from
             timeout: Request timeout in seconds
+            conditional: Skip the cache and revalidate now
 
         Returns:
             The parsed JSON data or None if failed
         """
         if timeout is None:
-            timeout = self.timeout
+            # Keep the client's timeout config (including its connect timeout)
+            timeout = httpx.USE_CLIENT_DEFAULT
 
+        load = self._revalidate_json if conditional else self._cached_json
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-        except (httpx.RequestError, httpx.HTTPStatusError) as error:
-            print(f"Error fetching JSON from {url}: {error}")
+            return await load(url, timeout)
+        except (httpx.RequestError, httpx.HTTPStatusError, ValueError) as error:
+            logger.warning("Error fetching JSON from %s: %s", url, error)
             return None
 
+    async def fetch_github_blobs(self, items: List[Dict[str, Any]]) -> Optional[List[Optional[str]]]:
+        """
+        Fetch the text of several GitHub search results in one GraphQL call.
+
+        GraphQL returns up to GITHUB_GRAPHQL_BATCH files per round trip
+        instead of one raw download per file. It requires a GitHub token.
+
+        Args:
+            items: Code search result items (with html_url and path)
+
+        Returns:
+            File texts in the same order as items (None where a file was
+            missing or binary), or None if the batch request failed
+        """
+        if not settings.github_token:
+            return None
+
+        variables: Dict[str, str] = {}
+        repositories: Dict[tuple, List[str]] = {}
+        for index, item in enumerate(items):
+            match = _BLOB_URL_RE.match(item['html_url'])
+            if not match:
+                return None
+            owner, name, ref = match.groups()
+            variables[f"e{index}"] = f"{ref}:{item['path']}"
+            repositories.setdefault((owner, name), []).append(
+                f'f{index}: object(expression: $e{index}) {{ ... on Blob {{ text }} }}')
+
+        # Values go in variables so paths never need GraphQL escaping
+        declarations = [f"$e{index}: String!" for index in range(len(items))]
+        selections = []
+        for repo_index, ((owner, name), fields) in enumerate(repositories.items()):
+            variables[f"o{repo_index}"] = owner
+            variables[f"n{repo_index}"] = name
+            declarations += [f"$o{repo_index}: String!", f"$n{repo_index}: String!"]
+            selections.append(
+                f"r{repo_index}: repository(owner: $o{repo_index}, name: $n{repo_index}) "
+                f"{{ {' '.join(fields)} }}")
+        graphql = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+
+        try:
+            response = await self._get_client().post(
+                GITHUB_GRAPHQL_URL, json={"query": graphql, "variables": variables})
+            response.raise_for_status()
+            data = orjson.loads(response.content).get("data")
+        except (httpx.RequestError, httpx.HTTPStatusError, ValueError) as error:
+            logger.warning("Error fetching GitHub blobs via GraphQL: %s", error)
+            return None
+        if not data:
+            return None
+
+        texts: Dict[str, Optional[str]] = {}
+        for repository in data.values():
+            for alias, blob in (repository or {}).items():
+                texts[alias] = blob.get("text") if blob else None
+        return [texts.get(f"f{index}") for index in range(len(items))]
+
     def extract_text_content(self, html: str, max_length: int = 200) -> str:
         """
         Extract clean text content from HTML.
@@ -205,17 +585,30 @@ class LangChainDocumentationService:
         if not html:
             return ""
 
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # lxml directly: no soup tree, and text aggregation stays in C
+        try:
+            try:
+                document = lxml.html.fromstring(html)
+            except ValueError:
+                # lxml refuses str input carrying an XML encoding declaration
+                document = lxml.html.fromstring(html.encode("utf-8"))
+        except (etree.ParserError, ValueError):
+            # Whitespace-only input has no document to parse
+            return ""
 
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip()
-                  for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Remove script and style elements (but keep the text that follows them)
+        etree.strip_elements(document, "script", "style", with_tail=False)
+
+        # Stop collecting once there is more visible text than fits; the
+        # normalized prefix starts the same as the full page text would
+        parts = []
+        visible = 0
+        for chunk in document.itertext():
+            parts.append(chunk)
+            visible += sum(map(len, chunk.split()))
+            if visible > max_length:
+                break
+        text = ' '.join(''.join(parts).split())
 
         return text[:max_length] + "..." if len(text) > max_length else text
 
@@ -230,62 +623,119 @@ class LangChainDocumentationService:
         Returns:
             Tuple of (description, methods list)
         """
+        try:
+            tree = ast.parse(file_content)
+        except SyntaxError:
+            # Source uses syntax this interpreter cannot parse
+            return self._extract_class_info_regex(file_content, class_name)
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef) and node.name == class_name:
+                description = (ast.get_docstring(node) or "").strip()
+                methods = [
+                    child.name for child in node.body
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+                    and not child.name.startswith('_')
+                ]
+                return description, methods
+
+        return "", []
+
+    def _extract_class_info_regex(self, file_content: str,
+                                  class_name: str) -> tuple[str, List[str]]:
+        """Fallback for extract_class_info when the source does not parse."""
         description = ""
         methods = []
 
         # Extract class definition and methods using regex
-        class_pattern = rf'class {class_name}\([^)]*\):'
-        class_match = re.search(class_pattern, file_content)
+        class_re = re.compile(rf'class {re.escape(class_name)}\([^)]*\):')
+        class_match = class_re.search(file_content)
 
         if class_match:
             # Extract docstring
-            docstring_pattern = r'"""(.*?)"""'
-            docstring_match = re.search(
-                docstring_pattern, file_content[class_match.end():], re.DOTALL)
+            docstring_match = _DOCSTRING_RE.search(file_content, class_match.end())
             if docstring_match:
                 description = docstring_match.group(1).strip()
 
             # Extract method names
-            method_pattern = r'def (\w+)\(self'
-            method_matches = re.findall(
-                method_pattern, file_content[class_match.start():])
+            method_matches = _METHOD_RE.findall(file_content, class_match.start())
             methods = [
                 method for method in method_matches if not method.startswith('_')]
 
         return description, methods
 
-    def determine_category_from_path(self, path: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def determine_category_from_path(path: str) -> str:
         """
         Determine content category based on URL path.
 
+        Results are memoized; the set of documentation paths is small.
+
         Args:
             path: The URL path
 
         Returns:
             The determined category
         """
-        category_map = {
-            "introduction": "Introduction",
-            "tutorials": "Tutorials",
-            "how_to": "How-To Guides",
-            "concepts": "Concepts",
-            "integrations": "Integrations",
-            "providers": "Providers",
-            "api_reference": "API Reference",
-            "chat": "Chat Models",
-            "llms": "LLMs",
-            "chains": "Chains",
-            "agents": "Agents",
-            "memory": "Memory",
-            "retrievers": "Retrievers",
-            "embeddings": "Embeddings"
-        }
+        match = _CATEGORY_RE.search(path.lower())
+        return _CATEGORY_MAP[match.group(0)] if match else "General"
 
-        for keyword, category in category_map.items():
-            if keyword in path.lower():
-                return category
+    @staticmethod
+    def _read_head(content: str) -> Optional[tuple[str, str]]:
+        """
+        Read the title and meta description from a page's <head> without parsing it.
 
-        return "General"
+        Args:
+            content: Raw HTML
+
+        Returns:
+            (title, description), or None when either is not in the head and
+            the page has to be parsed
+        """
+        head_end = content.find('</head>')
+        if head_end == -1:
+            return None
+        head = content[:head_end]
+
+        title_match = _TITLE_RE.search(head)
+        meta_match = _META_DESC_RE.search(head)
+        if not title_match or not meta_match:
+            return None
+
+        content_match = _CONTENT_ATTR_RE.search(meta_match.group(0))
+        description = (content_match.group(1) or content_match.group(2) or "") if content_match else ""
+        return html.unescape(title_match.group(1)), html.unescape(description)
+
+    async def _summarize_section(self, section_path: str, url: str,
+                                 content: str) -> DocSearchResult:
+        """Build the search result for a documentation section page that matched."""
+        head = self._read_head(content)
+        if head is not None:
+            title, description = head
+        else:
+            soup = await self._parse_html(content)
+            title_tag = soup.find('title')
+            title = title_tag.text if title_tag else section_path.split(
+                '/')[-1].replace('_', ' ').title()
+
+            # Extract description from meta description or first paragraph
+            meta_desc = soup.find('meta', attrs={'name': 'description'})
+            if meta_desc:
+                description = meta_desc.get('content', '')
+            else:
+                # Read the parsed tag's text; no need to re-serialize and re-parse it
+                first_p = soup.find('p')
+                text = ' '.join(first_p.get_text().split()) if first_p else ""
+                description = text[:200] + "..." if len(text) > 200 else text
+
+        return DocSearchResult(
+            title=title,
+            url=url,
+            summary=description,
+            category=self.determine_category_from_path(section_path),
+            last_updated=datetime.now().strftime("%Y-%m-%d")
+        )
 
     async def search_documentation(self, query: str, limit: int = 10) -> List[DocSearchResult]:
         """
@@ -298,51 +748,66 @@ class LangChainDocumentationService:
         Returns:
             List of documentation search results from the official LangChain docs
         """
-        # Define sections to search through (updated with latest LangChain structure)
-        sections_to_search = [
-            "/docs/introduction/",
-            "/docs/tutorials/",
-            "/docs/how_to/",
-            "/docs/concepts/",
-            "/docs/integrations/providers/",
-            "/api_reference/"
-        ]
-
         results = []
 
-        for section_path in sections_to_search:
+        # Sections are independent, so fetch them all at once; one failing
+        # section must not sink the others
+        pages = await asyncio.gather(
+            *(self.fetch_url(url) for url in SEARCH_SECTION_URLS),
+            return_exceptions=True)
+
+        # Case-insensitive scan of the raw page instead of lowercasing a copy of it
+        query_re = re.compile(re.escape(query), re.IGNORECASE)
+
+        for section_path, url, content in zip(SEARCH_SECTIONS, SEARCH_SECTION_URLS, pages):
             if len(results) >= limit:
                 break
 
-            url = urljoin(LANGCHAIN_DOCS_BASE, section_path)
-            content = await self.fetch_url(url)
+            if isinstance(content, str) and query_re.search(content):
+                results.append(await self._summarize_section(section_path, url, content))
 
-            if content and query.lower() in content.lower():
-                soup = BeautifulSoup(content, 'html.parser')
-                title_tag = soup.find('title')
-                title = title_tag.text if title_tag else section_path.split(
-                    '/')[-1].replace('_', ' ').title()
+        return results[:limit]
 
-                # Extract description from meta description or first paragraph
-                meta_desc = soup.find('meta', attrs={'name': 'description'})
-                if meta_desc:
-                    description = meta_desc.get('content', '')
-                else:
-                    first_p = soup.find('p')
-                    description = self.extract_text_content(
-                        str(first_p)) if first_p else ""
+    async def iter_search_documentation(self, query: str,
+                                        limit: int = 10) -> AsyncIterator[DocSearchResult]:
+        """
+        Yield documentation search results as each section page arrives.
 
-                category = self.determine_category_from_path(section_path)
+        Unlike search_documentation, results come in completion order rather
+        than section order, so the first match is available after the fastest
+        section responds instead of the slowest.
 
-                results.append(DocSearchResult(
-                    title=title,
-                    url=url,
-                    summary=description,
-                    category=category,
-                    last_updated=datetime.now().strftime("%Y-%m-%d")
-                ))
+        Args:
+            query: The search term or phrase
+            limit: Maximum number of results to yield
 
-        return results[:limit]
+        Yields:
+            Documentation search results from the official LangChain docs
+        """
+        query_re = re.compile(re.escape(query), re.IGNORECASE)
+
+        async def fetch(section_path: str, url: str) -> tuple:
+            try:
+                return section_path, url, await self.fetch_url(url)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # One failing section must not sink the others
+                return section_path, url, None
+
+        fetches = [asyncio.ensure_future(fetch(path, url))
+                   for path, url in zip(SEARCH_SECTIONS, SEARCH_SECTION_URLS)]
+        try:
+            found = 0
+            for next_page in asyncio.as_completed(fetches):
+                section_path, url, content = await next_page
+                if content and query_re.search(content):
+                    yield await self._summarize_section(section_path, url, content)
+                    found += 1
+                    if found >= limit:
+                        return
+        finally:
+            # Don't leave fetches running if the consumer stops early
+            for pending in fetches:
+                pending.cancel()
 
     async def get_api_reference(self, class_name: str) -> APIReference:
         """
@@ -367,16 +832,15 @@ class LangChainDocumentationService:
         file_url = file_info['html_url']
 
         # Get raw file content
-        raw_url = file_url.replace(
-            'github.com', 'raw.githubusercontent.com').replace('/blob/', '/')
+        raw_url = to_raw_url(file_url)
         file_content = await self.fetch_url(raw_url)
 
         if not file_content:
             raise ValueError("Could not fetch source code")
 
         # Parse the Python file to extract class information
-        description, methods = self.extract_class_info(
-            file_content, class_name)
+        description, methods = await asyncio.get_running_loop().run_in_executor(
+            self._get_parse_pool(), self.extract_class_info, file_content, class_name)
 
         # Get module path from file path
         module_path = file_info['path'].replace('/', '.').replace('.py', '')
@@ -388,19 +852,27 @@ class LangChainDocumentationService:
             methods=methods,
             parameters={},
             examples=[],
-            source_url=file_url
+            source_url=file_url,
+            source_sha=file_info.get('sha')
         )
 
-    async def get_github_examples(self, query: Optional[str] = None, limit: int = 5) -> List[GitHubExample]:
+    async def iter_github_examples(self, query: Optional[str] = None,
+                                   limit: int = 5) -> AsyncIterator[GitHubExample]:
         """
-        Get real code examples from the LangChain GitHub repository.
+        Yield real code examples from the LangChain GitHub repository.
+
+        With a GitHub token, file contents come from batched GraphQL calls.
+        Otherwise (or if GraphQL fails) raw files are downloaded concurrently
+        and examples are yielded in search order as soon as each one is
+        available, so callers can start sending results before the last
+        download finishes.
 
         Args:
             query: Optional search term to filter examples
-            limit: Maximum number of examples to return
+            limit: Maximum number of candidate files to fetch
 
-        Returns:
-            List of real code examples from the LangChain repository
+        Yields:
+            Code examples from the LangChain repository
         """
         # Search for Python example files in the LangChain repository
         search_query = f"extension:py {query or 'example'}"
@@ -409,26 +881,68 @@ class LangChainDocumentationService:
         search_results = await self.fetch_json(search_url)
 
         if not search_results or not search_results.get('items'):
-            return []
-
-        examples = []
-
-        for item in search_results['items'][:limit]:
-            # Get raw file content
-            raw_url = item['html_url'].replace(
-                'github.com', 'raw.githubusercontent.com').replace('/blob/', '/')
-            content = await self.fetch_url(raw_url)
-
-            # Only include reasonably sized files
-            if content and len(content) < 5000:
-                examples.append(GitHubExample(
-                    filename=item['name'],
-                    content=content,
-                    url=item['html_url'],
-                    description=f"Example from {item['path']}"
-                ))
+            return
+
+        items = search_results['items'][:limit]
+
+        # With a token, fetch the files in batched GraphQL calls
+        if settings.github_token:
+            batches = await asyncio.gather(*(
+                self.fetch_github_blobs(items[start:start + GITHUB_GRAPHQL_BATCH])
+                for start in range(0, len(items), GITHUB_GRAPHQL_BATCH)))
+            if all(batch is not None for batch in batches):
+                for item, content in zip(items, (text for batch in batches for text in batch)):
+                    if content and len(content) < MAX_EXAMPLE_CHARS:
+                        yield GitHubExample(
+                            filename=item['name'],
+                            content=content,
+                            url=item['html_url'],
+                            description=f"Example from {item['path']}"
+                        )
+                return
+
+        # Bound parallel downloads so GitHub doesn't rate-limit us
+        semaphore = asyncio.Semaphore(GITHUB_FETCH_CONCURRENCY)
+
+        async def fetch_bounded(raw_url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.fetch_text_limited(raw_url, MAX_EXAMPLE_CHARS)
+
+        # Start every raw file download up front, then yield in search order
+        fetches = [
+            asyncio.ensure_future(fetch_bounded(to_raw_url(item['html_url'])))
+            for item in items
+        ]
 
-        return examples
+        try:
+            for item, fetch in zip(items, fetches):
+                content = await fetch
+
+                # Only reasonably sized files come back
+                if content:
+                    yield GitHubExample(
+                        filename=item['name'],
+                        content=content,
+                        url=item['html_url'],
+                        description=f"Example from {item['path']}"
+                    )
+        finally:
+            # Don't leave downloads running if the consumer stops early
+            for fetch in fetches:
+                fetch.cancel()
+
+    async def get_github_examples(self, query: Optional[str] = None, limit: int = 5) -> List[GitHubExample]:
+        """
+        Get real code examples from the LangChain GitHub repository.
+
+        Args:
+            query: Optional search term to filter examples
+            limit: Maximum number of examples to return
+
+        Returns:
+            List of real code examples from the LangChain repository
+        """
+        return [example async for example in self.iter_github_examples(query, limit)]
 
     async def get_tutorials(self) -> List[TutorialInfo]:
         """
@@ -439,54 +953,42 @@ class LangChainDocumentationService:
         """
         # Fetch the main tutorials page
         tutorials_url = f"{LANGCHAIN_DOCS_BASE}/docs/tutorials/"
-        content = await self.fetch_url(tutorials_url)
+        content = await self.fetch_url(tutorials_url, conditional=True)
 
         if not content:
             raise ValueError("Could not fetch tutorials page")
 
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = await self._parse_html(content, _TUTORIAL_LINKS)
         tutorials = []
+        seen_urls: set[str] = set()
 
         # Find tutorial links (updated for new structure)
         for link in soup.find_all('a', href=True):
             href = link['href']
-            if href.startswith('/docs/') and any(
-                keyword in href for keyword in ['tutorials', 'concepts', 'introduction', 'how_to', 'integrations']
-            ):
-                title = link.text.strip()
-                if title and len(title) > 3:
-                    full_url = urljoin(LANGCHAIN_DOCS_BASE, href)
-
-                    # Determine category from URL (updated categories)
-                    category = "General"
-                    if "introduction" in href:
-                        category = "Introduction"
-                    elif "tutorial" in href:
-                        category = "Tutorials"
-                    elif "how_to" in href:
-                        category = "How-To Guides"
-                    elif "concepts" in href:
-                        category = "Concepts"
-                    elif "integrations" in href:
-                        category = "Integrations"
-
-                    tutorials.append(TutorialInfo(
-                        title=title,
-                        description=f"LangChain tutorial: {title}",
-                        url=full_url,
-                        category=category,
-                        topics=[category.lower().replace(" ", "_")]
-                    ))
-
-        # Remove duplicates
-        seen_urls = set()
-        unique_tutorials = []
-        for tutorial in tutorials:
-            if tutorial.url not in seen_urls:
-                seen_urls.add(tutorial.url)
-                unique_tutorials.append(tutorial)
-
-        return unique_tutorials[:10]  # Limit to 10 tutorials
+            title = link.text.strip()
+            if not title or len(title) <= 3:
+                continue
+
+            full_url = urljoin(LANGCHAIN_DOCS_BASE, href)
+            if full_url in seen_urls:
+                continue
+            seen_urls.add(full_url)
+
+            category = self.determine_category_from_path(href)
+
+            tutorials.append(TutorialInfo(
+                title=title,
+                description=f"LangChain tutorial: {title}",
+                url=full_url,
+                category=category,
+                topics=[category.lower().replace(" ", "_")],
+                difficulty=_DIFFICULTY_BY_CATEGORY.get(category)
+            ))
+
+            if len(tutorials) >= 10:  # Limit to 10 tutorials
+                break
+
+        return tutorials
 
     async def get_latest_version(self) -> VersionInfo:
         """
@@ -496,7 +998,7 @@ class LangChainDocumentationService:
             Latest version information from the official PyPI repository
         """
         pypi_url = "https://pypi.org/pypi/langchain/json"
-        data = await self.fetch_json(pypi_url)
+        data = await self.fetch_json(pypi_url, conditional=True)
 
         if not data:
             raise ValueError("Could not fetch version information")
@@ -524,6 +1026,20 @@ class LangChainDocumentationService:
             documentation_url=LANGCHAIN_DOCS_BASE
         )
 
+    async def refresh_static_data(self) -> None:
+        """
+        Reload the tutorials and version info, replacing their cached values.
+
+        Called periodically, this keeps those caches from ever going cold.
+        Failures are logged and leave the previous values in place.
+        """
+        results = await asyncio.gather(
+            self.get_tutorials.refresh(), self.get_latest_version.refresh(),
+            return_exceptions=True)
+        for name, result in zip(("tutorials", "latest version"), results):
+            if isinstance(result, Exception):
+                logger.warning("Error refreshing %s: %s", name, result)
+
     async def search_api_reference(self, query: str, limit: int = 5) -> List[DocSearchResult]:
         """
         Search through LangChain API reference using the official search.
@@ -547,35 +1063,41 @@ class LangChainDocumentationService:
         results = []
 
         if content:
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = await self._parse_html(content)
+
+            query_lower = query.lower()
+            today = datetime.now().strftime("%Y-%m-%d")
 
             # Look for API reference links and items
             for link in soup.find_all('a', href=True):
                 href = link['href']
+                if 'api_reference' not in href:
+                    continue
+
                 text = link.text.strip()
+                if not text or (query_lower not in text.lower() and query_lower not in href.lower()):
+                    continue
+
+                full_url = urljoin(LANGCHAIN_DOCS_BASE, href)
+
+                # Extract parent element for context
+                parent = link.parent
+                description = ""
+                if parent:
+                    desc_text = parent.get_text().strip()
+                    if len(desc_text) > len(text):
+                        description = self.extract_text_content(
+                            desc_text, 150)
+
+                results.append(DocSearchResult(
+                    title=text,
+                    url=full_url,
+                    summary=description or f"API reference for {text}",
+                    category="API Reference",
+                    last_updated=today
+                ))
 
-                if (href.startswith('/api_reference/') or 'api_reference' in href) and text:
-                    if query.lower() in text.lower() or query.lower() in href.lower():
-                        full_url = urljoin(LANGCHAIN_DOCS_BASE, href)
-
-                        # Extract parent element for context
-                        parent = link.parent
-                        description = ""
-                        if parent:
-                            desc_text = parent.get_text().strip()
-                            if len(desc_text) > len(text):
-                                description = self.extract_text_content(
-                                    desc_text, 150)
-
-                        results.append(DocSearchResult(
-                            title=text,
-                            url=full_url,
-                            summary=description or f"API reference for {text}",
-                            category="API Reference",
-                            last_updated=datetime.now().strftime("%Y-%m-%d")
-                        ))
-
-                        if len(results) >= limit:
-                            break
+                if len(results) >= limit:
+                    break
 
         return results
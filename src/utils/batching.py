@@ -0,0 +1,136 @@
+"""
+Request batching utilities.
+"""
+
+import abc
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncBatcher(abc.ABC, Generic[T, R]):
+    """
+    Collect items submitted concurrently and process them as one batch.
+
+    A batch is flushed when it reaches ``max_batch_size`` items or when the
+    first queued item has waited ``max_queue_time`` seconds, whichever
+    comes first. While no batch is running there is nothing to wait for,
+    so items are flushed on the next loop iteration instead. Subclasses
+    implement :meth:`process_batch`.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_queue_time: float = 0.02):
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only holds weak references to tasks, so keep running dispatches here
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def process(self, item: T) -> R:
+        """
+        Submit an item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The result produced for this item by :meth:`process_batch`
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            # Idle: only gather the callers submitting in this same iteration
+            delay = self.max_queue_time if self._dispatches else 0
+            self._timer = loop.call_later(delay, self._flush)
+
+        return await future
+
+    @abc.abstractmethod
+    async def process_batch(self, batch: List[T]) -> List[Any]:
+        """
+        Process a batch of items.
+
+        Args:
+            batch: Items in submission order
+
+        Returns:
+            One result per item, in the same order. An exception instance
+            in place of a result is raised to that item's caller.
+        """
+
+    async def aclose(self) -> None:
+        """Flush any queued items and wait for running batches to finish."""
+        self._flush()
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        try:
+            try:
+                results = await self.process_batch([item for item, _ in batch])
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                results = [error] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Cancelled, or too few results: never leave a caller waiting forever
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Batch produced no result for this item"))
+
+
+class SearchBatcher(AsyncBatcher[Tuple[str, int], List[Any]]):
+    """
+    Coalesce concurrent ``(query, limit)`` searches.
+
+    Each unique query in a batch is searched once with the largest
+    requested limit; every caller receives that result truncated to its
+    own limit.
+    """
+
+    def __init__(self, search: Callable[[str, int], Awaitable[List[Any]]],
+                 max_batch_size: int = 32, max_queue_time: float = 0.02):
+        super().__init__(max_batch_size, max_queue_time)
+        self._search = search
+
+    async def process_batch(self, batch: List[Tuple[str, int]]) -> List[Any]:
+        limits: Dict[str, int] = {}
+        for query, limit in batch:
+            limits[query] = max(limits.get(query, 0), limit)
+
+        queries = list(limits)
+        outcomes = await asyncio.gather(
+            *(self._search(query, limits[query]) for query in queries),
+            return_exceptions=True)
+        by_query = dict(zip(queries, outcomes))
+
+        results: List[Any] = []
+        for query, limit in batch:
+            outcome = by_query[query]
+            results.append(outcome if isinstance(
+                outcome, BaseException) else outcome[:limit])
+        return results
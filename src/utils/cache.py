@@ -0,0 +1,183 @@
+"""
+In-process caching utilities.
+"""
+
+import asyncio
+import functools
+import heapq
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+from .helpers import generate_cache_key
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Build a cache key from call arguments.
+
+    Hashable arguments are keyed on directly as a tuple; unhashable ones
+    fall back to a string digest.
+
+    Args:
+        args: Positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        A hashable cache key
+    """
+    key = args + tuple(sorted(kwargs.items())) if kwargs else args
+    try:
+        hash(key)
+    except TypeError:
+        return generate_cache_key(*key)
+    return key
+
+
+class TTLCache:
+    """
+    Bounded in-memory key/value cache with a fixed time-to-live per entry.
+
+    Entries are kept in LRU order; once ``max_entries`` is exceeded the least
+    recently used entry is evicted. Expired entries are purged from a heap
+    on every access, so stale keys that are never read again do not pile up.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._store: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._expiry: List[Tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+
+    def _purge_expired(self, now: float) -> None:
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires_at, _, key = heapq.heappop(expiry)
+            entry = self._store.get(key)
+            # Skip heap records superseded by a later set()
+            if entry is not None and entry[0] == expires_at:
+                del self._store[key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            The cached value or default
+        """
+        self._purge_expired(time.monotonic())
+
+        entry = self._store.get(key)
+        if entry is None:
+            return default
+
+        self._store.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        expires_at = now + self.ttl
+        self._store[key] = (expires_at, value)
+        self._store.move_to_end(key)
+        heapq.heappush(self._expiry, (expires_at, next(self._counter), key))
+
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+
+        # Evicted keys leave records behind; rebuild before the heap outgrows the store
+        if len(self._expiry) > 2 * self.max_entries:
+            self._expiry = [
+                (expires_at, seq, key) for expires_at, seq, key in self._expiry
+                if key in self._store and self._store[key][0] == expires_at
+            ]
+            heapq.heapify(self._expiry)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._store.clear()
+        self._expiry.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+def async_ttl_cache(ttl: float, max_entries: int = 1024) -> Callable[
+        [Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache the results of a coroutine function for ``ttl`` seconds.
+
+    Concurrent calls that miss the cache for the same arguments are
+    single-flighted: the first one starts the wrapped function in its own
+    task and every caller awaits that task, so cancelling any one caller
+    (the first included) never cancels the shared call. Exceptions are not
+    cached. The wrapper's ``refresh(*args)`` reloads an entry ahead of its
+    expiry.
+
+    Args:
+        ttl: Time-to-live in seconds
+        max_entries: Maximum number of cached results
+
+    Returns:
+        Decorator for coroutine functions
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache = TTLCache(ttl, max_entries)
+        # Also keeps a strong reference to each task until it finishes
+        inflight: Dict[Hashable, "asyncio.Task[T]"] = {}
+
+        async def load(key: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> T:
+            value = await func(*args, **kwargs)
+            cache.set(key, value)
+            return value
+
+        def finished(key: Hashable, task: "asyncio.Task[T]") -> None:
+            del inflight[key]
+            # Mark as retrieved in case every caller gave up waiting
+            if not task.cancelled():
+                task.exception()
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = make_key(args, kwargs)
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(load(key, args, kwargs))
+                inflight[key] = task
+                task.add_done_callback(functools.partial(finished, key))
+            # A caller giving up must not cancel the shared call
+            return await asyncio.shield(task)
+
+        async def refresh(*args: Any, **kwargs: Any) -> T:
+            """Re-run the wrapped function and replace its cached value."""
+            value = await func(*args, **kwargs)
+            cache.set(make_key(args, kwargs), value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.refresh = refresh  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
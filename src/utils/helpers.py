@@ -6,7 +6,13 @@ import hashlib
 import re
 from datetime import datetime
 from typing import Any, Optional
-from urllib.parse import quote, urljoin
+from urllib.parse import quote, urlencode, urljoin
+
+# Characters stripped from search queries (keeps spaces and basic punctuation)
+_UNSAFE_QUERY_CHARS_RE = re.compile(r'[^\w\s\-_.,!?]')
+# The same rule as a deletion table for the common all-ASCII case
+_UNSAFE_ASCII_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if _UNSAFE_QUERY_CHARS_RE.match(chr(c))))
 
 
 def generate_cache_key(*args: Any) -> str:
@@ -17,10 +23,14 @@ def generate_cache_key(*args: Any) -> str:
         *args: Arguments to include in the cache key
 
     Returns:
-        SHA-256 hash of the arguments
+        128-bit BLAKE2b hex digest of the arguments
     """
-    key_string = "|".join(str(arg) for arg in args)
-    return hashlib.sha256(key_string.encode()).hexdigest()
+    # Keys only need to be stable within the process, not cryptographically strong
+    digest = hashlib.blake2b(digest_size=16)
+    for arg in args:
+        digest.update(str(arg).encode())
+        digest.update(b"|")
+    return digest.hexdigest()
 
 
 def sanitize_query(query: str) -> str:
@@ -34,10 +44,12 @@ def sanitize_query(query: str) -> str:
         Sanitized query string
     """
     # Remove special characters but keep spaces and basic punctuation
-    sanitized = re.sub(r'[^\w\s\-_.,!?]', '', query)
+    if query.isascii():
+        sanitized = query.translate(_UNSAFE_ASCII_TABLE)
+    else:
+        sanitized = _UNSAFE_QUERY_CHARS_RE.sub('', query)
     # Normalize whitespace
-    sanitized = ' '.join(sanitized.split())
-    return sanitized.strip()
+    return ' '.join(sanitized.split())
 
 
 def build_url(base: str, path: str, **params: Any) -> str:
@@ -54,14 +66,9 @@ def build_url(base: str, path: str, **params: Any) -> str:
     """
     url = urljoin(base, path)
 
-    if params:
-        query_params = []
-        for key, value in params.items():
-            if value is not None:
-                query_params.append(f"{key}={quote(str(value))}")
-
-        if query_params:
-            url += "?" + "&".join(query_params)
+    query = {key: value for key, value in params.items() if value is not None}
+    if query:
+        url += "?" + urlencode(query, safe="/", quote_via=quote)
 
     return url
 
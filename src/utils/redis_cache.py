@@ -0,0 +1,98 @@
+"""
+Optional Redis-backed response cache shared across worker processes.
+"""
+
+from typing import Optional
+
+from ..config.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RedisCache:
+    """
+    Namespaced byte cache stored in Redis.
+
+    Requires the optional ``redis`` package. Until :meth:`connect` succeeds
+    every lookup is a miss and every write is dropped, so the application
+    runs unchanged without Redis. Runtime Redis errors are logged and
+    treated the same way; the cache never fails a request.
+    """
+
+    def __init__(self, url: str, namespace: str = "langchain-docs",
+                 max_connections: int = 20):
+        self.url = url
+        self.namespace = namespace
+        self.max_connections = max_connections
+        self._client = None
+        self._errors: tuple = ()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis connection is available."""
+        return self._client is not None
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def connect(self) -> None:
+        """Create the connection pool and check that Redis is reachable."""
+        try:
+            import redis.asyncio as redis  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            logger.warning("Redis cache enabled but the 'redis' package is not installed")
+            return
+
+        pool = redis.ConnectionPool.from_url(
+            self.url, max_connections=self.max_connections)
+        client = redis.Redis.from_pool(pool)
+        try:
+            await client.ping()
+        except redis.RedisError as error:
+            logger.warning("Redis cache unavailable at %s: %s", self.url, error)
+            await client.aclose()
+            return
+
+        self._client = client
+        self._errors = (redis.RedisError,)
+        logger.info("Connected to Redis cache at %s", self.url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key (without namespace)
+
+        Returns:
+            The cached bytes, or None on a miss or when Redis is unavailable
+        """
+        if self._client is None:
+            return None
+        try:
+            return await self._client.get(self._key(key))
+        except self._errors as error:
+            logger.warning("Redis GET failed for %s: %s", key, error)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Store a value with an expiry.
+
+        Args:
+            key: Cache key (without namespace)
+            value: Bytes to store
+            ttl: Time-to-live in seconds
+        """
+        if self._client is None:
+            return
+        try:
+            await self._client.set(self._key(key), value, ex=ttl)
+        except self._errors as error:
+            logger.warning("Redis SET failed for %s: %s", key, error)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
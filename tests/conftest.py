@@ -2,39 +2,239 @@
 Pytest configuration and fixtures.
 """
 
-import sys
-from pathlib import Path
+import weakref
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 
-# Add src to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+# Imported once here rather than inside every fixture call
+from src.api import fastapi_app
+from src.config.settings import settings
+from src.services import langchain_service as service_module
+from src.services.langchain_service import (
+    APIReference, DocSearchResult, GitHubExample, LangChainDocumentationService,
+    TutorialInfo, VersionInfo)
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    from src.api.fastapi_app import app  # pylint: disable=import-outside-toplevel
-    return TestClient(app)
+def pytest_addoption(parser):
+    """Add the --run-network flag."""
+    parser.addoption("--run-network", action="store_true", default=False,
+                     help="run tests marked as needing network access")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless --run-network is given."""
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="network (use --run-network)")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+# Canned upstream responses, by host, served to every service HTTP client
+_UPSTREAM = {
+    "pypi.org": {"json": {"info": {"version": "0.3.0", "summary": "Building applications with LLMs"}}},
+    "api.github.com": {"json": {"items": []}},
+    "python.langchain.com": {"text": "<html></html>"},
+}
+
+
+def _upstream(request):
+    """Answer an outbound request from the canned upstream table."""
+    canned = _UPSTREAM.get(request.url.host)
+    if canned is None:
+        return httpx.Response(404)
+    return httpx.Response(200, **canned)
+
+
+@pytest.fixture(autouse=True)
+def mocked_upstream(monkeypatch):
+    """Route the service's outbound HTTP to canned responses instead of the internet."""
+    # pylint: disable=protected-access
+    def create_mock_client(timeout=service_module.REQUEST_TIMEOUT):
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(_upstream),
+            timeout=timeout,
+            headers={"User-Agent": service_module.USER_AGENT},
+            event_hooks={"request": [service_module._authorize_github]},
+        )
+
+    monkeypatch.setattr(service_module, "create_http_client", create_mock_client)
+
+
+@pytest_asyncio.fixture
+async def service_with_handler():
+    """
+    Build documentation services whose requests are answered by a handler.
+
+    Call it with an ``httpx.MockTransport`` handler to get a fresh service;
+    it is closed after the test. Services are only held weakly, so tests
+    can still check that one gets garbage collected.
+    """
+    services = weakref.WeakSet()
+    clients = []
+
+    def build(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        service = LangChainDocumentationService(http_client=client)
+        services.add(service)
+        return service
+
+    yield build
+    for service in list(services):
+        await service.aclose()
+    for client in clients:
+        await client.aclose()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """
+    Create an async client for the FastAPI app, shared by a test module.
+
+    Requests go straight to the ASGI app, so tests using it must run on the
+    module's event loop (``pytest.mark.asyncio(loop_scope="module")``).
+    Tests that change app behaviour should do so with the function-scoped
+    ``monkeypatch`` fixture so the change is undone before the next test.
+    """
+    app = fastapi_app.app
+    with pytest.MonkeyPatch.context() as patch:
+        # Keep startup from reaching out to the real upstream sites
+        patch.setattr(settings, "prewarm_cache", False)
+        # Run the app lifespan around the client, as a server would
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+                yield test_client
+
+
+@pytest.fixture(scope="session")
+def langchain_service():
+    """
+    A documentation service shared by the whole session.
+
+    Only use it for tests that leave no state behind (no fetches, patches
+    or cache entries); build a fresh service for anything else.
+    """
+    return LangChainDocumentationService()
 
 
 @pytest.fixture
-def mock_langchain_service():
-    """Mock LangChain service for testing."""
-    # This would contain mock implementations
-    # for isolated unit testing
-    return None
+def mock_langchain_service(monkeypatch):
+    """Serve canned results from the app's documentation service, without network."""
+    service = fastapi_app.doc_service
+
+    def search_result(query, i):
+        return DocSearchResult(
+            title=f"{query} {i}",
+            url=f"https://python.langchain.com/docs/{query}/{i}/",
+            summary=f"About {query}",
+            category="Concepts",
+            last_updated="2025-01-01",
+        )
+
+    async def search(query, limit=10):
+        return [search_result(query, i) for i in range(limit)]
+
+    async def iter_search(query, limit=10):
+        for i in range(limit):
+            yield search_result(query, i)
+
+    async def get_api_reference(class_name):
+        return APIReference(
+            class_name=class_name,
+            module_path=f"langchain.{class_name.lower()}",
+            description=f"LangChain {class_name} class",
+            methods=["invoke"],
+            parameters={},
+            examples=[],
+            source_url=f"https://github.com/langchain-ai/langchain/blob/master/{class_name}.py",
+            source_sha=f"sha-{class_name}",
+        )
+
+    async def iter_github_examples(query=None, limit=5):
+        for i in range(limit):
+            yield GitHubExample(
+                filename=f"{query}_{i}.py",
+                content="print('hello')",
+                url=f"https://github.com/langchain-ai/langchain/blob/master/{query}_{i}.py",
+                description=f"Example from {query}_{i}.py",
+            )
+
+    # Built once: like the real cached service, every call returns the same list
+    tutorials = [TutorialInfo(
+        title=f"Tutorial {i}",
+        description=f"LangChain tutorial: Tutorial {i}",
+        url=f"https://python.langchain.com/docs/tutorials/{i}/",
+        category="Tutorials",
+        topics=["tutorials"],
+    ) for i in range(10)]
+
+    async def get_tutorials():
+        return tutorials
+
+    async def get_latest_version():
+        return VersionInfo(
+            latest_version="0.3.0",
+            description="Building applications with LLMs",
+            author="",
+            homepage="",
+            release_date="2025-01-01T00:00:00Z",
+            python_requires=">=3.9",
+            pypi_url="https://pypi.org/project/langchain/",
+            documentation_url="https://python.langchain.com",
+        )
+
+    monkeypatch.setattr(service, "search_documentation", search)
+    monkeypatch.setattr(service, "iter_search_documentation", iter_search)
+    monkeypatch.setattr(service, "search_api_reference", search)
+    monkeypatch.setattr(service, "get_api_reference", get_api_reference)
+    monkeypatch.setattr(service, "iter_github_examples", iter_github_examples)
+    monkeypatch.setattr(service, "get_tutorials", get_tutorials)
+    monkeypatch.setattr(service, "get_latest_version", get_latest_version)
+    return service
+
+
+class FakeRedis:
+    """In-memory stand-in for a ``redis.asyncio`` client."""
+
+    class Error(Exception):
+        """Stand-in for ``redis.RedisError``."""
+
+    def __init__(self):
+        self.store = {}
+        # Set to make every call fail as if Redis went away
+        self.fail = False
+
+    async def get(self, key):
+        """Return the stored value, or None."""
+        if self.fail:
+            raise self.Error("connection lost")
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):  # pylint: disable=unused-argument
+        """Store a value."""
+        if self.fail:
+            raise self.Error("connection lost")
+        self.store[key] = value
+
+    async def aclose(self):
+        """Close the (imaginary) connection pool."""
 
 
 @pytest.fixture
-def sample_search_query():
-    """Sample search query for testing."""
-    return "llm"
+def redis_client():
+    """An in-memory Redis client stand-in."""
+    return FakeRedis()
 
 
 @pytest.fixture
-def sample_class_name():
-    """Sample class name for testing."""
-    return "ChatOpenAI"
+def fake_redis(monkeypatch, redis_client):
+    """Connect the app's response cache to the in-memory Redis stand-in."""
+    # pylint: disable=protected-access
+    monkeypatch.setattr(fastapi_app.response_cache, "_client", redis_client)
+    monkeypatch.setattr(fastapi_app.response_cache, "_errors", (FakeRedis.Error,))
+    return redis_client
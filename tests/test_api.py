@@ -2,12 +2,45 @@
 Tests for the FastAPI endpoints.
 """
 
-from fastapi.testclient import TestClient
+import asyncio
+import inspect
+import json
+import logging
 
+import httpx
+import pytest
+from fastapi.routing import APIRoute
 
-def test_health_endpoint(client: TestClient):
+from src.api import fastapi_app
+from src.config.settings import settings
+from src.services.langchain_service import LangChainDocumentationService, TutorialInfo
+
+# Tests share the module-scoped client, so they run on its event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+def _returning(value):
+    """Build a stand-in service method that returns ``value``."""
+    async def fake(*_args, **_kwargs):
+        return value
+    return fake
+
+
+def _tutorial(title, difficulty=None):
+    """Build a tutorial with the given title."""
+    return TutorialInfo(
+        title=title,
+        description=f"LangChain tutorial: {title}",
+        url="https://python.langchain.com/docs/tutorials/",
+        category="Tutorials",
+        topics=["tutorials"],
+        difficulty=difficulty,
+    )
+
+
+async def test_health_endpoint(client: httpx.AsyncClient):
     """Test the health endpoint."""
-    response = client.get("/health")
+    response = await client.get("/health")
 
     assert response.status_code == 200
     data = response.json()
@@ -19,71 +52,331 @@ def test_health_endpoint(client: TestClient):
     assert data["endpoints_available"] == 7
 
 
-def test_search_documentation_endpoint(client: TestClient, sample_search_query: str):
-    """Test the search documentation endpoint."""
-    response = client.get(f"/search?query={sample_search_query}&max_results=5")
+async def test_requests_are_access_logged_once(client: httpx.AsyncClient, caplog):
+    """Test that each request produces a single access log record."""
+    with caplog.at_level("INFO", logger="src.api.middleware"):
+        await client.get("/health")
+
+    records = [r for r in caplog.records if r.name == "src.api.middleware"]
+    assert len(records) == 1
+    assert records[0].getMessage().startswith("GET /health -> 200 in ")
+
+
+async def test_endpoints_are_async():
+    """Test that no endpoint is dispatched to the threadpool."""
+    sync_routes = [
+        route.path for route in fastapi_app.app.routes
+        if isinstance(route, APIRoute)
+        and not inspect.iscoroutinefunction(route.endpoint)
+    ]
+    assert sync_routes == []
+
 
-    # Should return 200 even if no results (empty list)
-    # May fail due to network issues in tests
-    assert response.status_code in [200, 500]
+@pytest.mark.usefixtures("mock_langchain_service")
+@pytest.mark.parametrize("path, expected_len", [
+    ("/search?query=llm&max_results=5", 5),
+    ("/search/api?query=llm&max_results=3", 3),
+    ("/examples/github?topic=chat&max_results=2", 2),
+    ("/tutorials?max_results=5", 5),
+])
+async def test_list_endpoints(client: httpx.AsyncClient, path: str, expected_len: int):
+    """Test that the list endpoints return at most max_results items."""
+    response = await client.get(path)
 
-    if response.status_code == 200:
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) <= 5
+    assert response.status_code == 200
+    assert len(response.json()) == expected_len
+
+
+@pytest.mark.usefixtures("mock_langchain_service")
+@pytest.mark.parametrize("path, field, value", [
+    ("/api-reference/ChatOpenAI", "class_name", "ChatOpenAI"),
+    ("/latest-version", "latest_version", "0.3.0"),
+])
+async def test_object_endpoints(client: httpx.AsyncClient, path: str, field: str, value: str):
+    """Test the single-object endpoints."""
+    response = await client.get(path)
+
+    assert response.status_code == 200
+    assert response.json()[field] == value
+
+
+async def test_latest_version_from_upstream(client: httpx.AsyncClient):
+    """Test /latest-version end to end against the canned PyPI response."""
+    response = await client.get("/latest-version")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["latest_version"] == "0.3.0"
+    assert data["description"] == "Building applications with LLMs"
+    assert data["pypi_url"] == "https://pypi.org/project/langchain/"
 
 
-def test_search_documentation_invalid_params(client: TestClient):
+async def test_search_documentation_invalid_params(client: httpx.AsyncClient):
     """Test search endpoint with invalid parameters."""
     # Test missing query parameter
-    response = client.get("/search")
+    response = await client.get("/search")
     assert response.status_code == 422  # Validation error
 
     # Test invalid max_results
-    response = client.get("/search?query=test&max_results=0")
+    response = await client.get("/search?query=test&max_results=0")
     assert response.status_code == 422  # Validation error
 
 
-def test_search_api_documentation_endpoint(client: TestClient, sample_search_query: str):
-    """Test the search API documentation endpoint."""
-    response = client.get(
-        f"/search/api?query={sample_search_query}&max_results=3")
+@pytest.mark.usefixtures("mock_langchain_service")
+async def test_latest_version_conditional_get(client: httpx.AsyncClient):
+    """Test that /latest-version supports ETag revalidation."""
+    response = await client.get("/latest-version")
+    assert response.status_code == 200
+    assert response.json()["latest_version"] == "0.3.0"
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    response = await client.get("/latest-version", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.usefixtures("mock_langchain_service")
+async def test_etag_skips_other_paths(client: httpx.AsyncClient):
+    """Test that responses outside the ETag paths are left untouched."""
+    response = await client.get("/search?query=test")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+@pytest.mark.usefixtures("mock_langchain_service")
+async def test_tutorials_reuse_serialized_body_for_cached_results(
+        client: httpx.AsyncClient, monkeypatch):
+    """Test that a cached service result is only serialized once."""
+    renders = []
+
+    def counting_dump(adapter, results):
+        renders.append(len(results))
+        return original_dump(adapter, results)
+
+    original_dump = fastapi_app._dump  # pylint: disable=protected-access
+    monkeypatch.setattr(fastapi_app, "_dump", counting_dump)
+
+    first = await client.get("/tutorials?max_results=7")
+    second = await client.get("/tutorials?max_results=7")
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert first.json()[0]["title"] == "Tutorial 0"
+    assert renders == [7]
+
+
+async def test_tutorials_filter_by_difficulty(client: httpx.AsyncClient, monkeypatch):
+    """Test that the difficulty filter is a case-insensitive substring match."""
+    tutorials = [_tutorial("Chatbot", "Beginner"), _tutorial("Agents", "Advanced"),
+                 _tutorial("RAG", "beginner"), _tutorial("Untagged")]
+    monkeypatch.setattr(fastapi_app.doc_service, "get_tutorials", _returning(tutorials))
+
+    beginner = await client.get("/tutorials?difficulty=BEGINNER")
+    partial = await client.get("/tutorials?difficulty=adv")
+    unknown = await client.get("/tutorials?difficulty=expert")
+    everything = await client.get("/tutorials")
+
+    assert [t["title"] for t in beginner.json()] == ["Chatbot", "RAG"]
+    assert [t["title"] for t in partial.json()] == ["Agents"]
+    assert unknown.json() == []
+    assert len(everything.json()) == 4
+
+
+async def test_tutorials_filter_scraped_tutorials_by_difficulty(client: httpx.AsyncClient):
+    """Test the difficulty filter against tutorials parsed by the real service."""
+    page = ('<html><body><a href="/docs/tutorials/chatbot/">Build a Chatbot</a>'
+            '<a href="/docs/how_to/streaming/">How to stream</a>'
+            '<a href="/docs/integrations/chat/">Chat integrations</a></body></html>')
+    service = LangChainDocumentationService()
+    service.fetch_url = _returning(page)
+
+    fastapi_app.app.dependency_overrides[fastapi_app.get_doc_service] = lambda: service
+    try:
+        beginner = await client.get("/tutorials?difficulty=beginner")
+        intermediate = await client.get("/tutorials?difficulty=INTER")
+    finally:
+        fastapi_app.app.dependency_overrides.clear()
+
+    assert [t["title"] for t in beginner.json()] == ["Build a Chatbot"]
+    assert [t["difficulty"] for t in intermediate.json()] == ["Intermediate"]
+
 
-    # Should return 200 even if no results (empty list)
-    # May fail due to network issues in tests
-    assert response.status_code in [200, 500]
+@pytest.mark.usefixtures("mock_langchain_service")
+async def test_search_documentation_serializes_results(client: httpx.AsyncClient):
+    """Test that service search results are returned as JSON."""
+    response = await client.get("/search?query=llm&max_results=2")
+
+    assert response.status_code == 200
+    assert response.json() == [{
+        "title": f"llm {i}",
+        "url": f"https://python.langchain.com/docs/llm/{i}/",
+        "summary": "About llm",
+        "category": "Concepts",
+        "last_updated": "2025-01-01",
+    } for i in range(2)]
+
+
+@pytest.mark.usefixtures("mock_langchain_service")
+async def test_large_responses_are_compressed(client: httpx.AsyncClient):
+    """Test that list responses above the threshold are gzip-encoded."""
+    response = await client.get("/search?query=llm&max_results=20",
+                                headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 20
+
+
+async def test_github_examples_are_streamed(
+        client: httpx.AsyncClient, mock_langchain_service, monkeypatch):
+    """Test that /examples/github streams a JSON array of examples."""
+    response = await client.get("/examples/github?topic=chat&max_results=3")
+    assert response.status_code == 200
+    assert [e["filename"] for e in response.json()] == [
+        "chat_0.py", "chat_1.py", "chat_2.py"]
+
+    canned = mock_langchain_service.iter_github_examples
+    monkeypatch.setattr(mock_langchain_service, "iter_github_examples",
+                        lambda query, limit: canned(query, 0))
+    response = await client.get("/examples/github?topic=chat")
+    assert response.json() == []
+
+
+async def test_github_examples_stream_closes_array_after_a_failure(
+        client: httpx.AsyncClient, mock_langchain_service, monkeypatch):
+    """Test that a failure after the first example still yields a valid JSON array."""
+    canned = mock_langchain_service.iter_github_examples
+
+    async def failing_examples(query, limit):  # pylint: disable=unused-argument
+        async for example in canned(query, 1):
+            yield example
+        raise RuntimeError("GitHub went away")
+
+    monkeypatch.setattr(mock_langchain_service, "iter_github_examples", failing_examples)
+
+    response = await client.get("/examples/github?topic=chat&max_results=3")
+
+    assert response.status_code == 200
+    assert [e["filename"] for e in response.json()] == ["chat_0.py"]
+
+
+@pytest.mark.usefixtures("mock_langchain_service")
+async def test_api_reference_uses_source_sha_as_etag(client: httpx.AsyncClient):
+    """Test that /api-reference is validated by the GitHub blob SHA."""
+    response = await client.get("/api-reference/ChatOpenAI")
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"sha-ChatOpenAI"'
+    assert response.headers["cache-control"] == "public, max-age=86400"
+
+    response = await client.get("/api-reference/ChatOpenAI",
+                                headers={"If-None-Match": '"sha-ChatOpenAI"'})
+    assert response.status_code == 304
 
 
-def test_get_api_reference_endpoint(client: TestClient, sample_class_name: str):
-    """Test the get API reference endpoint."""
-    response = client.get(f"/api-reference/{sample_class_name}")
+async def test_cached_endpoint_reads_through_redis(
+        client: httpx.AsyncClient, mock_langchain_service, fake_redis, monkeypatch):
+    """Test that a Redis miss stores the response and a hit skips the service."""
+    calls = []
+    canned = mock_langchain_service.get_latest_version
 
-    # Should return 200, 404, or 500 depending on availability
-    assert response.status_code in [200, 404, 500]
+    async def counting_latest_version():
+        calls.append(True)
+        return await canned()
 
+    monkeypatch.setattr(mock_langchain_service, "get_latest_version", counting_latest_version)
 
-def test_get_github_examples_endpoint(client: TestClient):
-    """Test the GitHub examples endpoint."""
-    response = client.get("/examples/github?topic=chat&max_results=2")
+    miss = await client.get("/latest-version")
+    hit = await client.get("/latest-version")
 
-    # Should return 200 even if no results (empty list)
-    # May fail due to network issues in tests
-    assert response.status_code in [200, 500]
+    assert miss.status_code == hit.status_code == 200
+    assert hit.content == miss.content
+    assert hit.headers["etag"] == miss.headers["etag"]
+    assert calls == [True]
+    assert [key.split(":")[:2] for key in fake_redis.store] == [["langchain-docs", "latest-version"]]
 
 
-def test_get_tutorials_endpoint(client: TestClient):
-    """Test the tutorials endpoint."""
-    response = client.get("/tutorials?max_results=5")
+async def test_cached_endpoint_falls_back_when_redis_fails(
+        client: httpx.AsyncClient, mock_langchain_service, fake_redis, monkeypatch):
+    """Test that Redis errors are treated as misses and never fail the request."""
+    calls = []
+    canned = mock_langchain_service.get_latest_version
 
-    # Should return 200 even if no results (empty list)
-    # May fail due to network issues in tests
-    assert response.status_code in [200, 500]
+    async def counting_latest_version():
+        calls.append(True)
+        return await canned()
 
+    monkeypatch.setattr(mock_langchain_service, "get_latest_version", counting_latest_version)
+    fake_redis.fail = True
 
-def test_get_latest_version_endpoint(client: TestClient):
-    """Test the latest version endpoint."""
-    response = client.get("/latest-version")
+    responses = [await client.get("/latest-version") for _ in range(2)]
 
-    # Should return 200 or 500 depending on PyPI availability
-    # May fail due to network issues in tests
-    assert response.status_code in [200, 500]
+    assert [r.status_code for r in responses] == [200, 200]
+    assert responses[0].json()["latest_version"] == "0.3.0"
+    assert calls == [True, True]
+
+
+async def test_startup_prewarms_slow_caches(monkeypatch):
+    """Test that startup loads tutorials and version info in the background."""
+    refreshed = asyncio.Event()
+    tasks = []
+
+    async def fake_refresh():
+        tasks.append(asyncio.current_task())
+        refreshed.set()
+
+    monkeypatch.setattr(settings, "prewarm_cache", True)
+    monkeypatch.setattr(fastapi_app.doc_service, "refresh_static_data", fake_refresh)
+
+    app = fastapi_app.app
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+            assert (await test_client.get("/health")).status_code == 200
+            # The refresh runs in the background; startup must not wait for it
+            await asyncio.wait_for(refreshed.wait(), timeout=1)
+
+    # Shutdown waits for the cancelled refresher to finish
+    assert tasks[0].done()
+
+
+async def test_startup_configures_logging_in_workers(monkeypatch):
+    """Test that a worker process with no logging setup configures it at startup."""
+    calls = []
+    monkeypatch.setattr(fastapi_app, "setup_logging", lambda: calls.append(True))
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+
+    app = fastapi_app.app
+    async with app.router.lifespan_context(app):
+        pass
+
+    assert calls == [True]
+
+
+async def test_doc_service_dependency_can_be_overridden(client: httpx.AsyncClient):
+    """Test that endpoints get the service through FastAPI dependency injection."""
+    class FakeService:  # pylint: disable=too-few-public-methods
+        """Stand-in documentation service."""
+
+        get_tutorials = _returning([_tutorial("Injected")])
+
+    fastapi_app.app.dependency_overrides[fastapi_app.get_doc_service] = FakeService
+    try:
+        response = await client.get("/tutorials")
+    finally:
+        fastapi_app.app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert [t["title"] for t in response.json()] == ["Injected"]
+
+
+@pytest.mark.usefixtures("mock_langchain_service")
+async def test_search_streams_ndjson(client: httpx.AsyncClient):
+    """Test that ?stream=true returns one JSON document per line."""
+    response = await client.get("/search", params={"query": "llm", "max_results": 2, "stream": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["llm 0", "llm 1"]
@@ -2,31 +2,18 @@
 Integration tests for the complete application.
 """
 
-import sys
-from pathlib import Path
+import pytest
 
 from src.config.settings import settings
 
-# Add src to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
 
+@pytest.mark.network
 def test_server_startup_and_health():
-    """Test that the server starts up and responds to health checks."""
-    # Note: This is a basic integration test
-    # In a real scenario, you'd start the server in a separate process
-    # and then test it
+    """Test that a server running on localhost:8000 passes the health check."""
+    # pylint: disable=import-outside-toplevel
+    from scripts.health_check import health_check
 
-    # For now, just test the health check function
-    try:
-        from scripts.health_check import health_check  # pylint: disable=import-outside-toplevel
-        # This will fail if no server is running, which is expected in tests
-        result = health_check("localhost", 8000)
-        # We don't assert here because the server might not be running
-        print(f"Health check result: {result}")
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        print(f"Integration test note: {e}")
+    assert health_check("localhost", 8000)
 
 
 def test_configuration_loading():
@@ -36,14 +23,25 @@ def test_configuration_loading():
     assert settings.langchain_docs_base == "https://python.langchain.com"
 
 
-def test_logging_setup():
-    """Test that logging can be set up."""
+def test_logging_setup(tmp_path, monkeypatch):
+    """Test that logging setup writes records to logs/app.log."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    import logging
+
+    from src.config import logging as app_logging
+
+    root = logging.getLogger()
+    # Keep the session's root handlers and level out of reach of basicConfig(force=True)
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.chdir(tmp_path)
+
+    app_logging.setup_logging("INFO")
     try:
-        # pylint: disable=import-outside-toplevel
-        from src.config.logging import setup_logging, get_logger
-        setup_logging()
-        logger = get_logger(__name__)
-        logger.info("Test log message")
-        assert True  # If we get here, logging setup worked
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        assert False, f"Logging setup failed: {e}"
+        app_logging.get_logger(__name__).info("Test log message")
+    finally:
+        # Stopping the listener flushes queued records to the file
+        app_logging._stop_listener()
+
+    log_file = tmp_path / "logs" / "app.log"
+    assert " - INFO - Test log message" in log_file.read_text(encoding="utf-8")
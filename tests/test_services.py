@@ -2,42 +2,436 @@
 Tests for the LangChain service layer.
 """
 
-import sys
-from pathlib import Path
+import asyncio
+import gc
+import importlib
+import json
+import weakref
 
+import httpx
 import pytest
 
-# Add src to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+from src.config.settings import settings
+from src.services import langchain_service as service_module
+from src.services.langchain_service import SEARCH_SECTION_URLS, LangChainDocumentationService
 
 
-def test_langchain_service_import():
-    """Test that the LangChain service can be imported."""
-    try:
-        # pylint: disable=import-outside-toplevel
-        from src.services.langchain_service import LangChainDocumentationService
+@pytest.mark.parametrize("module, names", [
+    ("src.services.langchain_service", (
+        "LangChainDocumentationService", "DocSearchResult", "APIReference",
+        "GitHubExample", "TutorialInfo", "VersionInfo")),
+    ("src.models.schemas", (
+        "DocSearchResult", "APIReference", "GitHubExample", "TutorialInfo",
+        "VersionInfo", "HealthResponse")),
+])
+def test_imports(module, names):
+    """Test that the service and schema modules expose their public names."""
+    imported = importlib.import_module(module)
+    assert [name for name in names if not hasattr(imported, name)] == []
+
+
+@pytest.mark.asyncio
+async def test_service_reuses_http_client():
+    """Test that the service shares one HTTP client until closed."""
+    # pylint: disable=protected-access
+    service = LangChainDocumentationService()
+    first = service._get_client()
+    assert service._get_client() is first
+    assert first.headers["User-Agent"].startswith("langchain-mcp-server/")
+    await service.aclose()
+    assert first.is_closed
+    assert service._get_client() is not first
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_github_examples_fetch_concurrently_in_order():
+    """Test that raw example files are downloaded concurrently."""
+    service = LangChainDocumentationService()
+    started = []
+
+    async def fake_fetch_json(_url, timeout=None):  # pylint: disable=unused-argument
+        return {"items": [{
+            "name": f"example_{i}.py",
+            "path": f"docs/example_{i}.py",
+            "html_url": f"https://github.com/langchain-ai/langchain/blob/main/example_{i}.py",
+        } for i in range(3)]}
+
+    async def fake_fetch_text_limited(url, max_chars, timeout=None):  # pylint: disable=unused-argument
+        started.append(url)
+        # Later files finish first; results must still come back in order
+        await asyncio.sleep(0.01 * (3 - len(started)))
+        return f"# {url}"
+
+    service.fetch_json = fake_fetch_json
+    service.fetch_text_limited = fake_fetch_text_limited
+
+    examples = await service.get_github_examples("chat", 3)
+
+    assert len(started) == 3
+    assert all(url.startswith("https://raw.githubusercontent.com/") for url in started)
+    assert [e.filename for e in examples] == [
+        "example_0.py", "example_1.py", "example_2.py"]
+
+
+@pytest.mark.asyncio
+async def test_github_examples_bound_concurrent_downloads():
+    """Test that raw example downloads are capped at the configured concurrency."""
+    service = LangChainDocumentationService()
+    active = []
+    peak = []
+
+    async def fake_fetch_json(_url, timeout=None):  # pylint: disable=unused-argument
+        return {"items": [{
+            "name": f"example_{i}.py",
+            "path": f"docs/example_{i}.py",
+            "html_url": f"https://github.com/langchain-ai/langchain/blob/main/example_{i}.py",
+        } for i in range(12)]}
+
+    async def fake_fetch_text_limited(url, max_chars, timeout=None):  # pylint: disable=unused-argument
+        active.append(url)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(url)
+        return f"# {url}"
+
+    service.fetch_json = fake_fetch_json
+    service.fetch_text_limited = fake_fetch_text_limited
+
+    examples = await service.get_github_examples("chat", 12)
+
+    assert len(examples) == 12
+    assert max(peak) == service_module.GITHUB_FETCH_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_search_documentation_fetches_sections_concurrently():
+    """Test that documentation sections are fetched in parallel."""
+    service = LangChainDocumentationService()
+    in_flight = []
+    peak = []
+
+    async def fake_fetch_url(url, timeout=None, conditional=False):  # pylint: disable=unused-argument
+        in_flight.append(url)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(url)
+        if "tutorials" in url:
+            raise RuntimeError("section unavailable")
+        if "concepts" in url:
+            return "<html><head><title>Concepts</title></head><p>About LLM chains</p></html>"
+        return "<html><p>nothing here</p></html>"
+
+    service.fetch_url = fake_fetch_url
+
+    results = await service.search_documentation("llm", 5)
+
+    assert max(peak) == 6
+    assert [r.title for r in results] == ["Concepts"]
+    assert results[0].category == "Concepts"
+
+
+def test_extract_class_info_scopes_methods_to_class(langchain_service):
+    """Test that only the target class's public methods are extracted."""
+    source = '''
+class ChatOpenAI(BaseChatModel):
+    """OpenAI chat model."""
+
+    def invoke(self, prompt):
+        pass
+
+    async def ainvoke(self, prompt):
+        pass
+
+    def _private(self):
+        pass
+
+
+class Other:
+    def unrelated(self):
+        pass
+'''
+    assert langchain_service.extract_class_info(source, "ChatOpenAI") == (
+        "OpenAI chat model.", ["invoke", "ainvoke"])
+    assert langchain_service.extract_class_info(source, "Missing") == ("", [])
+
+
+@pytest.mark.asyncio
+async def test_get_tutorials_dedupes_and_limits_links():
+    """Test that tutorial links are deduplicated and capped at ten."""
+    links = ['<a href="/docs/tutorials/chatbot/">Build a Chatbot</a>'] * 3
+    links += [f'<a href="/docs/how_to/guide_{i}/">Guide {i}</a>' for i in range(20)]
+    links.append('<a href="/docs/other/">Unrelated page</a>')
+    page = "<html><body>" + "".join(links) + "</body></html>"
+
+    async def fake_fetch_url(url, timeout=None, conditional=False):  # pylint: disable=unused-argument
+        return page
+
+    service = LangChainDocumentationService()
+    service.fetch_url = fake_fetch_url
+    tutorials = await service.get_tutorials()
+
+    assert len(tutorials) == 10
+    assert len({tutorial.url for tutorial in tutorials}) == 10
+    assert tutorials[0].category == "Tutorials"
+    assert tutorials[1].category == "How-To Guides"
+    assert [t.difficulty for t in tutorials[:2]] == ["Beginner", "Intermediate"]
+
+
+def test_extract_text_content_strips_scripts_and_collapses_whitespace(langchain_service):
+    """Test that visible text is extracted, normalized and truncated."""
+    service = langchain_service
+    html = "<div><style>p {}</style><p>Build  with\n  <b>LangChain</b></p><script>x()</script></div>"
+
+    assert service.extract_text_content(html) == "Build with LangChain"
+    assert service.extract_text_content("word " * 10, max_length=9) == "word word..."
+    assert service.extract_text_content("   ") == ""
+    declared = '<?xml version="1.0" encoding="utf-8"?><html><body><p>Café guide</p></body></html>'
+    assert service.extract_text_content(declared) == "Café guide"
+
+
+@pytest.mark.asyncio
+async def test_fetch_text_limited_rejects_oversized_bodies(service_with_handler):
+    """Test that long bodies are abandoned instead of returned."""
+    def handler(request):
+        size = 10 if request.url.path == "/small.py" else 10_000
+        return httpx.Response(200, text="x" * size)
+
+    service = service_with_handler(handler)
+    small = await service.fetch_text_limited("https://example.com/small.py", 5000)
+    large = await service.fetch_text_limited("https://example.com/large.py", 5000)
+
+    assert small == "x" * 10
+    assert large is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_caches_unconditional_fetches(service_with_handler):
+    """Test that repeated and concurrent fetches of a URL share one request."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path == "/missing/":
+            return httpx.Response(404)
+        return httpx.Response(200, text="<html>docs</html>")
+
+    service = service_with_handler(handler)
+    url = "https://example.com/docs/"
+    pages = await asyncio.gather(service.fetch_url(url), service.fetch_url(url))
+    pages.append(await service.fetch_url(url))
+    missing = [await service.fetch_url("https://example.com/missing/") for _ in range(2)]
+
+    assert pages == ["<html>docs</html>"] * 3
+    assert missing == [None, None]
+    assert seen == ["/docs/", "/missing/", "/missing/"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_revalidates_with_etag(service_with_handler):
+    """Test that a 304 Not Modified reuses the previously fetched body."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<html>docs</html>", headers={"ETag": '"v1"'})
+
+    service = service_with_handler(handler)
+    url = "https://example.com/docs/"
+
+    assert [await service.fetch_url(url, conditional=True) for _ in range(2)] == [
+        "<html>docs</html>"] * 2
+    assert seen == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_page_cache_single_flights_overlapping_misses(service_with_handler):
+    """Test that a second caller arriving mid-fetch waits for the first request."""
+    # pylint: disable=protected-access
+    seen = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        seen.append(request.url.path)
+        await release.wait()
+        return httpx.Response(200, text="<html>docs</html>")
+
+    service = service_with_handler(handler)
+    url = "https://example.com/docs/"
+    first = asyncio.ensure_future(service._cached_text(url, service.timeout))
+    await asyncio.sleep(0.01)
+    # The first request is now in flight upstream
+    second = asyncio.ensure_future(service._cached_text(url, service.timeout))
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await asyncio.gather(first, second) == ["<html>docs</html>"] * 2
+    assert seen == ["/docs/"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_searches_fetch_each_section_once(service_with_handler):
+    """Test that section pages are served from the page cache, then revalidated."""
+    # pylint: disable=protected-access
+    seen = []
+
+    def handler(request):
+        seen.append((str(request.url), request.headers.get("if-none-match")))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<html><p>About LLM chains</p></html>",
+                              headers={"ETag": '"v1"'})
+
+    service = service_with_handler(handler)
+    first = await service.search_documentation("llm", 10)
+    second = await service.search_documentation("llm", 10)
+    # Expired pages are revalidated rather than downloaded again
+    service._cached_text.cache.clear()
+    third = await service.search_documentation("llm", 10)
+
+    counts = [len(first), len(second), len(third)]
+    service_ref = weakref.ref(service)
+    del service
+    gc.collect()
+
+    sections = len(SEARCH_SECTION_URLS)
+    assert counts == [sections] * 3
+    assert sorted(url for url, _ in seen) == sorted(SEARCH_SECTION_URLS * 2)
+    assert [etag for _, etag in seen] == [None] * sections + ['"v1"'] * sections
+    # The page cache belongs to the instance and doesn't keep it alive
+    assert service_ref() is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_returns_none_for_malformed_bodies(service_with_handler):
+    """Test that an unparseable JSON body fails softly on both fetch paths."""
+    service = service_with_handler(
+        lambda _request: httpx.Response(200, text="<html>not json</html>"))
+    url = "https://example.com/data.json"
+
+    assert await service.fetch_json(url) is None
+    assert await service.fetch_json(url, conditional=True) is None
+
+
+@pytest.mark.asyncio
+async def test_github_token_is_only_sent_to_the_github_api(monkeypatch):
+    """Test that the configured token never leaks to other upstream hosts."""
+    # pylint: disable=protected-access
+    monkeypatch.setattr(settings, "github_token", "secret")
+    github = httpx.Request("GET", "https://api.github.com/search/code?q=x")
+    pypi = httpx.Request("GET", "https://pypi.org/pypi/langchain/json")
+
+    await service_module._authorize_github(github)
+    await service_module._authorize_github(pypi)
+
+    assert github.headers["authorization"] == "Bearer secret"
+    assert "authorization" not in pypi.headers
+
+
+@pytest.mark.asyncio
+async def test_github_examples_use_one_graphql_call_with_token(monkeypatch, service_with_handler):
+    """Test that a GitHub token switches raw downloads to a batched GraphQL query."""
+    monkeypatch.setattr(settings, "github_token", "secret")
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.endswith("/search/code"):
+            return httpx.Response(200, json={"items": [{
+                "name": f"example_{i}.py",
+                "path": f"docs/example_{i}.py",
+                "html_url": f"https://github.com/langchain-ai/langchain/blob/main/docs/example_{i}.py",
+            } for i in range(3)]})
+        variables = json.loads(request.content)["variables"]
+        assert variables["e0"] == "main:docs/example_0.py"
+        return httpx.Response(200, json={"data": {"r0": {
+            "f0": {"text": "print('zero')"},
+            "f1": None,
+            "f2": {"text": "x" * 6000},
+        }}})
+
+    examples = await service_with_handler(handler).get_github_examples("chat", 3)
+
+    assert [e.filename for e in examples] == ["example_0.py"]
+    assert requests[1:] == ["/graphql"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_static_data_replaces_cached_values():
+    """Test that a refresh reloads cached version info before it expires."""
+    versions = iter(["0.3.0", "0.3.1"])
+
+    async def fake_fetch_json(url, timeout=None, conditional=False):  # pylint: disable=unused-argument
+        return {"info": {"version": next(versions)}, "releases": {}}
+
+    async def fake_fetch_url(url, timeout=None, conditional=False):  # pylint: disable=unused-argument
+        return '<a href="/docs/tutorials/chatbot/">Build a Chatbot</a>'
+
+    service = LangChainDocumentationService()
+    service.fetch_json = fake_fetch_json
+    service.fetch_url = fake_fetch_url
+
+    first = await service.get_latest_version()
+    await service.refresh_static_data()
+    refreshed = await service.get_latest_version()
+
+    assert first.latest_version == "0.3.0"
+    assert refreshed.latest_version == "0.3.1"
+
+
+@pytest.mark.asyncio
+async def test_result_caches_are_per_instance():
+    """Test that cached results are neither shared across services nor keep them alive."""
+    def service_for(version):
+        async def fake_fetch_json(url, timeout=None, conditional=False):  # pylint: disable=unused-argument
+            return {"info": {"version": version}, "releases": {}}
+
         service = LangChainDocumentationService()
-        assert service is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import LangChainDocumentationService: {e}")
-
-
-def test_service_models_import():
-    """Test that service models can be imported."""
-    try:
-        # pylint: disable=import-outside-toplevel
-        from src.services.langchain_service import (
-            DocSearchResult,
-            APIReference,
-            GitHubExample,
-            TutorialInfo,
-            VersionInfo
-        )
-        assert all([DocSearchResult, APIReference,
-                   GitHubExample, TutorialInfo, VersionInfo])
-    except ImportError as e:
-        pytest.fail(f"Failed to import service models: {e}")
+        service.fetch_json = fake_fetch_json
+        return service
+
+    first, second = service_for("0.3.0"), service_for("0.3.1")
+
+    assert [(await service.get_latest_version()).latest_version
+            for service in (first, second)] == ["0.3.0", "0.3.1"]
+
+    ref = weakref.ref(first)
+    del first
+    gc.collect()
+    assert ref() is None
+
+
+@pytest.mark.asyncio
+async def test_iter_search_documentation_yields_in_completion_order():
+    """Test that streamed search results arrive as soon as each section responds."""
+    delays = {"introduction": 0.03, "concepts": 0.01}
+
+    async def fake_fetch_url(url, timeout=None, conditional=False):  # pylint: disable=unused-argument
+        for section, delay in delays.items():
+            if section in url:
+                await asyncio.sleep(delay)
+                return f"<html><head><title>{section}</title></head><p>LLM</p></html>"
+        return "<html><p>nothing</p></html>"
+
+    service = LangChainDocumentationService()
+    service.fetch_url = fake_fetch_url
+
+    titles = [r.title async for r in service.iter_search_documentation("llm", 5)]
+    assert titles == ["concepts", "introduction"]
+
+
+def test_read_head_extracts_title_and_description_without_parsing():
+    """Test that section summaries come from the <head> when it has both fields."""
+    # pylint: disable=protected-access
+    page = ('<html><head><title>Agents &amp; Tools</title>'
+            '<meta content="Don&#x27;t panic" name="description"></head><body></body></html>')
+    no_meta = '<html><head><title>Agents</title></head><body><p>First</p></body></html>'
+
+    read_head = LangChainDocumentationService._read_head
+    assert read_head(page) == ("Agents & Tools", "Don't panic")
+    assert read_head(no_meta) is None
 
 
 # Note: Additional service tests would go here
@@ -0,0 +1,215 @@
+"""
+Tests for the utility helpers.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from src.utils.batching import AsyncBatcher, SearchBatcher
+from src.utils.cache import TTLCache, async_ttl_cache, make_key
+from src.utils.redis_cache import RedisCache
+
+
+@pytest.mark.asyncio
+async def test_search_batcher_coalesces_identical_queries():
+    """Test that concurrent identical searches share one upstream call."""
+    calls = []
+
+    async def search(query, limit):
+        calls.append((query, limit))
+        return [f"{query}-{i}" for i in range(limit)]
+
+    batcher = SearchBatcher(search, max_queue_time=0.01)
+    results = await asyncio.gather(
+        batcher.process(("llm", 2)),
+        batcher.process(("llm", 5)),
+        batcher.process(("agents", 1)),
+    )
+
+    assert sorted(calls) == [("agents", 1), ("llm", 5)]
+    assert results[0] == ["llm-0", "llm-1"]
+    assert len(results[1]) == 5
+    assert results[2] == ["agents-0"]
+
+
+@pytest.mark.asyncio
+async def test_search_batcher_keeps_dispatches_until_closed():
+    """Test that running batches are tracked and awaited on close."""
+    async def search(query, limit):
+        await asyncio.sleep(0.01)
+        return [query] * limit
+
+    # pylint: disable=protected-access
+    batcher = SearchBatcher(search, max_batch_size=1)
+    pending = asyncio.ensure_future(batcher.process(("llm", 2)))
+    await asyncio.sleep(0)
+    assert len(batcher._dispatches) == 1
+    await batcher.aclose()
+    assert len(batcher._dispatches) == 0
+    assert await pending == ["llm", "llm"]
+
+
+class _EchoBatcher(AsyncBatcher):
+    """Batcher returning its items, or whatever ``results`` says."""
+
+    def __init__(self, results=None, **kwargs):
+        super().__init__(**kwargs)
+        self.results = results
+        self.batches = []
+
+    async def process_batch(self, batch):
+        self.batches.append(batch)
+        return batch if self.results is None else await self.results(batch)
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_at_once_when_idle():
+    """Test that a lone item doesn't wait out the queue time."""
+    batcher = _EchoBatcher(max_queue_time=10)
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.process(1), batcher.process(2)), timeout=1)
+
+    assert results == [1, 2]
+    # Items submitted together still share one batch
+    assert batcher.batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_fails_items_left_without_a_result():
+    """Test that short results and cancelled batches fail the waiting callers."""
+    async def short(batch):
+        return batch[:1]
+
+    async def hang(batch):  # pylint: disable=unused-argument
+        await asyncio.Event().wait()
+
+    batcher = _EchoBatcher(short)
+    first, second = await asyncio.gather(
+        batcher.process(1), batcher.process(2), return_exceptions=True)
+    assert first == 1
+    assert isinstance(second, RuntimeError)
+
+    batcher = _EchoBatcher(hang)
+    pending = asyncio.ensure_future(batcher.process(1))
+    await asyncio.sleep(0.01)
+    for task in batcher._dispatches:  # pylint: disable=protected-access
+        task.cancel()
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(pending, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_runs_once_per_key():
+    """Test that concurrent cache misses share a single call."""
+    calls = []
+
+    @async_ttl_cache(ttl=60)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    assert await asyncio.gather(fetch("a"), fetch("a"), fetch("b")) == ["A", "A", "B"]
+    assert await fetch("a") == "A"
+    assert sorted(calls) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_shares_errors_without_caching_them():
+    """Test that waiters see the in-flight error and a later call retries."""
+    calls = []
+
+    @async_ttl_cache(ttl=60)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ValueError("upstream down")
+        return key
+
+    first, second = await asyncio.gather(fetch("a"), fetch("a"), return_exceptions=True)
+    assert isinstance(first, ValueError) and isinstance(second, ValueError)
+    assert await fetch("a") == "a"
+    assert calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_survives_first_caller_cancellation():
+    """Test that cancelling the caller that started a load leaves other waiters unaffected."""
+    calls = []
+
+    @async_ttl_cache(ttl=60)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    leader = asyncio.ensure_future(fetch("a"))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(fetch("a"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "A"
+    assert leader.cancelled()
+    assert await fetch("a") == "A"
+    assert calls == ["a"]
+
+
+def test_make_key_uses_tuples_and_falls_back_for_unhashable_args():
+    """Test that cache keys are tuples unless an argument is unhashable."""
+    assert make_key(("llm", 5), {}) == ("llm", 5)
+    assert make_key(("llm",), {"limit": 5}) == ("llm", ("limit", 5))
+    assert isinstance(make_key((["a", "b"],), {}), str)
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired_entries():
+    """Test that the cache stays bounded and drops expired entries."""
+    cache = TTLCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    expired = TTLCache(ttl=0)
+    expired.set("a", 1)
+    expired.set("b", 2)
+    assert len(expired) == 1
+    assert expired.get("b") is None
+    assert len(expired) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_is_a_no_op_until_connected(monkeypatch):
+    """Test that a missing redis package leaves the cache disabled instead of failing."""
+    monkeypatch.setitem(sys.modules, "redis", None)
+    cache = RedisCache("redis://localhost:6379/0")
+
+    await cache.connect()
+    await cache.set("search:abc", b"body", 60)
+
+    assert await cache.get("search:abc") is None
+    assert not cache.enabled
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_namespaces_keys_and_swallows_errors(redis_client):
+    """Test that values round-trip under the namespace and Redis errors become misses."""
+    # pylint: disable=protected-access
+    client = redis_client
+    cache = RedisCache("redis://localhost:6379/0", namespace="test")
+    cache._client = client
+    cache._errors = (client.Error,)
+
+    await cache.set("search:abc", b"body", 60)
+    assert await cache.get("search:abc") == b"body"
+
+    client.fail = True
+    await cache.set("search:def", b"other", 60)
+    assert await cache.get("search:abc") is None
+    assert client.store == {"test:search:abc": b"body"}
+